@@ -7,15 +7,25 @@ Toolkit plugin system.
 
 from __future__ import annotations
 
+import copy
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from orlando_toolkit.core.plugins.base import BasePlugin, AppContext
 from orlando_toolkit.core.plugins.interfaces import UIExtension
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    try:
+        from yaml import SafeLoader as _YamlLoader
+    except ImportError:
+        _YamlLoader = None
+
 # Export the plugin class explicitly
 __all__ = ['VideoConverterPlugin']
 
@@ -26,6 +36,9 @@ class VideoConverterPlugin(BasePlugin, UIExtension):
     This plugin provides video to DITA conversion capabilities including
     document handling, structure tab UI integration, and inline video preview.
     """
+
+    # Parsed config.yml shared across instances, keyed by (path, mtime_ns)
+    _CONFIG_CACHE: ClassVar[Dict[Tuple[str, int], Dict[str, Any]]] = {}
     
     def __init__(self, plugin_id: str, metadata: 'PluginMetadata', plugin_dir: str) -> None:
         """Initialize the video converter plugin.
@@ -37,6 +50,10 @@ class VideoConverterPlugin(BasePlugin, UIExtension):
         """
         super().__init__(plugin_id, metadata, plugin_dir)
         self._document_handler: Optional[Any] = None
+        self._panel_factory = VideoPreviewPanelFactory(self)
+        # (kind, name) pairs registered through register_components, if used
+        self._batched_components: Optional[List[Tuple[str, str]]] = None
+        self._default_config = self._load_default_config_from_disk()
         
         # Load plugin-specific configuration
         try:
@@ -46,14 +63,27 @@ class VideoConverterPlugin(BasePlugin, UIExtension):
             self.log_warning(f"Failed to load plugin configuration: {e}")
             # Continue with default configuration
         
-    # Provide default configuration by loading our config.yml
+    # Provide default configuration from our config.yml (parsed once per instance)
     def _get_default_config(self) -> Dict[str, Any]:
+        default_config = getattr(self, '_default_config', None)
+        if default_config is None:
+            default_config = self._default_config = self._load_default_config_from_disk()
+        # Fresh copy per call: callers may merge user config into the result
+        return copy.deepcopy(default_config)
+
+    def _load_default_config_from_disk(self) -> Dict[str, Any]:
         try:
             import yaml
             config_path = Path(self.plugin_dir) / 'config.yml'
             if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
+                key = (str(config_path), config_path.stat().st_mtime_ns)
+                cached = self._CONFIG_CACHE.get(key)
+                if cached is None:
+                    with open(config_path, 'r', encoding='utf-8') as f:
+                        cached = yaml.load(f, Loader=_YamlLoader) or {}
+                    self._CONFIG_CACHE[key] = cached
+                # Hand out a private copy so callers cannot mutate the cache
+                return copy.deepcopy(cached)
         except Exception as e:
             self.log_warning(f"Using empty default config (error reading config.yml): {e}")
         return {}
@@ -135,12 +165,31 @@ class VideoConverterPlugin(BasePlugin, UIExtension):
         }
     
     def register_ui_components(self, ui_registry: Any) -> None:
-        """Register UI components with the UI registry."""
+        """Register UI components with the UI registry.
+
+        Hosts exposing ``register_components(payload, plugin_id)`` receive all
+        components in one call; otherwise each is registered individually.
+        """
         try:
+            # Prefer the host's batched registration when available
+            register_components = getattr(ui_registry, 'register_components', None)
+            if callable(register_components):
+                # Same components the per-call path below would register
+                payload = [('panel_factory', 'video_preview', self._panel_factory)]
+                if hasattr(ui_registry, 'register_plugin_capability'):
+                    payload.append(('plugin_capability', 'video_preview', None))
+                launcher = self._create_workflow_launcher()
+                if launcher is not None:
+                    payload.append(('workflow_launcher', self.plugin_id, launcher))
+                register_components(payload, self.plugin_id)
+                self._batched_components = [(kind, name) for kind, name, _ in payload]
+                self.log_debug(f"Registered {len(payload)} UI components in one batch")
+                return
+
             # Register video preview panel factory for structure tab (PanelFactory object)
             ui_registry.register_panel_factory(
                 'video_preview',
-                VideoPreviewPanelFactory(self),
+                self._panel_factory,
                 self.plugin_id
             )
             self.log_debug("Registered video preview panel factory")
@@ -151,22 +200,39 @@ class VideoConverterPlugin(BasePlugin, UIExtension):
                 self.log_debug("Registered video preview capability")
 
             # Register optional workflow launcher so the plugin controls UX
-            try:
-                from .ui.launcher import VideoWorkflowLauncher
-                if hasattr(ui_registry, 'register_workflow_launcher'):
-                    ui_registry.register_workflow_launcher(self.plugin_id, VideoWorkflowLauncher(self))
+            if hasattr(ui_registry, 'register_workflow_launcher'):
+                launcher = self._create_workflow_launcher()
+                if launcher is not None:
+                    ui_registry.register_workflow_launcher(self.plugin_id, launcher)
                     self.log_debug("Registered workflow launcher")
-            except Exception as e:
-                # Non-fatal: fall back to host's single-file flow
-                self.log_warning(f"Could not register workflow launcher: {e}")
                 
         except Exception as e:
             self.log_error(f"Failed to register UI components: {e}")
             raise
+
+    def _create_workflow_launcher(self) -> Optional[Any]:
+        """Build the plugin-owned workflow launcher, or None if unavailable."""
+        try:
+            from .ui.launcher import VideoWorkflowLauncher
+            return VideoWorkflowLauncher(self)
+        except Exception as e:
+            # Non-fatal: fall back to host's single-file flow
+            self.log_warning(f"Could not register workflow launcher: {e}")
+            return None
     
     def unregister_ui_components(self, ui_registry: Any) -> None:
         """Unregister UI components from the UI registry."""
         try:
+            # Mirror register_ui_components: one batched call for exactly
+            # what was registered in a batch
+            unregister_components = getattr(ui_registry, 'unregister_components', None)
+            registered = self._batched_components
+            if callable(unregister_components) and registered is not None:
+                unregister_components(registered, self.plugin_id)
+                self._batched_components = None
+                self.log_debug("Unregistered UI components in one batch")
+                return
+
             # Unregister panel factory
             if hasattr(ui_registry, 'unregister_panel_factory'):
                 ui_registry.unregister_panel_factory('video_preview', self.plugin_id)
@@ -190,7 +256,7 @@ class VideoConverterPlugin(BasePlugin, UIExtension):
     def get_panel_factories(self) -> Dict[str, Any]:
         """Get panel factories provided by this extension."""
         return {
-            'video_preview': VideoPreviewPanelFactory(self)
+            'video_preview': self._panel_factory
         }
     
     def get_marker_providers(self) -> Dict[str, Any]:
@@ -241,30 +307,14 @@ class VideoPreviewPanelFactory:
         try:
             if hasattr(panel, 'cleanup'):
                 panel.cleanup()
+            if hasattr(panel, 'destroy'):
+                panel.destroy()
         except Exception:
             pass
 
     # Provide defaults if host queries role
     def get_role(self) -> str:
         return 'plugin'
-
-    # Configuration defaults loader
-    # Ensure BasePlugin.load_config() creates sensible defaults
-    # by overriding _get_default_config in the plugin instance
-
-    # Attach method on plugin class (monkey via instance attribute set in __init__)
-
-
-    def get_button_emoji(self) -> str:
-        # Clapper board emoji for video
-        return "\U0001F3AC"
-
-    def cleanup_panel(self, panel) -> None:
-        try:
-            if hasattr(panel, 'destroy'):
-                panel.destroy()
-        except Exception:
-            pass
     
     # -------------------------------------------------------------------------
     # Utility Methods
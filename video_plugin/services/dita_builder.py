@@ -7,17 +7,54 @@ from video files, creating proper DITA XML structures with video elements.
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional
 from datetime import datetime
 import re
-import xml.dom.minidom
+from xml.sax.saxutils import escape as xml_escape
 
-from lxml import etree as ET
 from orlando_toolkit.core.models import DitaContext
 
+if TYPE_CHECKING:
+    from lxml import etree as ET
+
 logger = logging.getLogger(__name__)
 
+# Topic ID sanitising: drop anything but word chars and separators, then
+# collapse separator runs into a single hyphen
+_TOPIC_ID_INVALID = re.compile(r"[^\w .-]")
+_TOPIC_ID_SEPARATORS = re.compile(r"[ ._-]+")
+
+# Skeleton for the optional metadata table; {rows} receives escaped <row> markup
+_METADATA_TABLE_TEMPLATE = (
+    '<table frame="all" rowsep="1" colsep="1">'
+    '<title>Video Information</title>'
+    '<tgroup cols="2">'
+    '<colspec colname="property" colwidth="1*"/>'
+    '<colspec colname="value" colwidth="2*"/>'
+    '<thead><row><entry>Property</entry><entry>Value</entry></row></thead>'
+    '<tbody>{rows}</tbody>'
+    '</tgroup>'
+    '</table>'
+)
+
+# manual_reference normalisation (measured no slower than a str.translate
+# table plus run-collapsing on typical titles, and handles non-ASCII as-is)
+_MANUAL_REF_NONALNUM = re.compile(r"[^A-Za-z0-9]+")
+_MANUAL_REF_DASHES = re.compile(r"-{2,}")
+
+# Extension (without dot) -> MIME type for embedded video objects
+_MIME_TYPES: Mapping[str, str] = MappingProxyType({
+    'mp4': 'video/mp4',
+    'avi': 'video/x-msvideo',
+    'mov': 'video/quicktime',
+    'wmv': 'video/x-ms-wmv',
+    'webm': 'video/webm',
+    'mkv': 'video/x-matroska',
+})
+
 
 class VideoDitaBuilder:
     """DITA document construction for video content."""
@@ -32,6 +69,9 @@ class VideoDitaBuilder:
         self.metadata = metadata
         self.config = plugin_config
         self._logger = logging.getLogger(__name__)
+        dita_config = plugin_config.get('dita_integration', {})
+        self._preserve_names = bool(dita_config.get('preserve_original_filenames', True))
+        self._stream_videos = bool(dita_config.get('stream_video_files', False))
     
     def create_dita_context(self, video_path: Path, video_info: Dict[str, Any], 
                            poster_image: Optional[bytes] = None) -> DitaContext:
@@ -46,25 +86,29 @@ class VideoDitaBuilder:
             DitaContext with video topic and media files
         """
         context = DitaContext()
+        today = self._current_date_ymd()
         
-        # Generate topic ID and filename
+        # Generate topic ID, topic filename and media filename once
         topic_id = self._generate_topic_id(video_info['filename'])
         topic_filename = f"{topic_id}.dita"
+        video_filename = self._get_video_media_filename(video_info['filename'])
         
         # Build video topic
-        topic_element = self.build_video_topic(topic_id, video_info)
+        topic_element = self.build_video_topic(topic_id, video_info, video_filename)
         context.topics[topic_filename] = topic_element
         
         # Add video file to videos dict (proper separation from images)
-        video_filename = self._get_video_media_filename(video_info['filename'])
-        with open(video_path, 'rb') as f:
-            context.videos[video_filename] = f.read()
+        if self._stream_videos:
+            # Host copies from the source file when writing the archive
+            context.videos[video_filename] = Path(video_path)
+        else:
+            context.videos[video_filename] = self._read_video_bytes(video_path)
         
         # Remove poster image generation (KISS principle - not essential)
         # Videos should reference original files, not generate derived images
         
         # Create DITAMAP
-        ditamap_root = self._create_ditamap(topic_filename, video_info)
+        ditamap_root = self._create_ditamap(topic_filename, video_info, today)
         context.ditamap_root = ditamap_root
         # Provide DOCTYPE hints for SaaS compatibility (core will use them if present)
         try:
@@ -84,28 +128,27 @@ class VideoDitaBuilder:
         })
         # Prefill UI fields if absent
         context.metadata.setdefault('manual_title', 'VIDEO-LIBRARY')
-        try:
-            # YYYY-MM-DD current date
-            context.metadata.setdefault('revision_date', datetime.utcnow().strftime('%Y-%m-%d'))
-        except Exception:
-            pass
+        context.metadata.setdefault('revision_date', today)
         
-        self._logger.info(f"Created DITA context for video: {video_info['filename']}")
+        self._logger.info("Created DITA context for video: %s", video_info['filename'])
         return context
     
-    def build_video_topic(self, topic_id: str, video_info: Dict[str, Any]) -> ET.Element:
+    def build_video_topic(self, topic_id: str, video_info: Dict[str, Any],
+                          media_filename: Optional[str] = None) -> ET.Element:
         """Build DITA topic with video element and metadata.
         
         Args:
             topic_id: Unique topic identifier
             video_info: Video metadata dictionary
+            media_filename: Media filename if already resolved by the caller
             
         Returns:
             DITA topic element
         """
+        from lxml import etree as ET
+
         # Create concept topic
-        topic = ET.Element("concept")
-        topic.set("id", topic_id)
+        topic = ET.Element("concept", attrib={"id": topic_id})
         
         # Add title
         from pathlib import Path as _P
@@ -113,56 +156,39 @@ class VideoDitaBuilder:
         title = ET.SubElement(topic, "title")
         title.text = title_text
         
-        # Add short description
-        shortdesc = ET.SubElement(topic, "shortdesc")
-        duration_str = video_info.get('duration_formatted', 'Unknown duration')
-        size_str = f"{video_info.get('file_size_mb', 0)}MB"
-        resolution_str = f"{video_info.get('width', 0)}Ã—{video_info.get('height', 0)}"
-        shortdesc.text = (
-            f"Video content: {duration_str}, "
-            f"{video_info.get('width', 0)}×{video_info.get('height', 0)}, "
-            f"{size_str}"
-        )
-        
-        # Create concept body
+        # Create concept body (no shortdesc: keep topic minimal)
         conbody = ET.SubElement(topic, "conbody")
-        # Ensure no shortdesc remains (keep topic minimal)
-        try:
-            sd = topic.find('shortdesc')
-            if sd is not None:
-                topic.remove(sd)
-        except Exception:
-            pass
         
         # Add video element
-        self._add_video_element(conbody, topic_id, video_info)
+        self._add_video_element(conbody, topic_id, video_info, media_filename)
         
         # No metadata table in XML (panel will show a tooltip)
         
-        self._logger.debug(f"Built DITA topic for {video_info['filename']}")
+        self._logger.debug("Built DITA topic for %s", video_info['filename'])
         return topic
     
-    def _add_video_element(self, parent: ET.Element, topic_id: str, video_info: Dict[str, Any]) -> None:
+    def _add_video_element(self, parent: ET.Element, topic_id: str, video_info: Dict[str, Any],
+                           media_filename: Optional[str] = None) -> None:
         """Add DITA video element to parent.
         
         Args:
             parent: Parent element to add video to
             topic_id: Topic ID for media file references
             video_info: Video metadata dictionary
+            media_filename: Media filename if already resolved by the caller
         """
+        from lxml import etree as ET
+
         # Create object-based embedded video
-        obj = ET.SubElement(parent, "object")
-        
-        # Set object attributes
-        video_filename = self._get_video_media_filename(video_info['filename'])
-        obj.set("data", f"../media/{video_filename}")
-        obj.set("outputclass", "video")
-        obj.set("type", self._get_video_mime_type(video_info.get('extension', '')))
+        video_filename = media_filename or self._get_video_media_filename(video_info['filename'])
+        obj = ET.SubElement(parent, "object", attrib={
+            "data": f"../media/{video_filename}",
+            "outputclass": "video",
+            "type": self._get_video_mime_type(video_info.get('extension', '')),
+        })
         
         # Controls parameter (object param)
-        param = ET.SubElement(obj, "param")
-        param.set("name", "controls")
-        param.set("value", "true")
+        ET.SubElement(obj, "param", attrib={"name": "controls", "value": "true"})
     
     def _add_metadata_table(self, parent: ET.Element, video_info: Dict[str, Any]) -> None:
         """Add video metadata table to parent element.
@@ -171,46 +197,12 @@ class VideoDitaBuilder:
             parent: Parent element to add table to
             video_info: Video metadata dictionary
         """
-        # Create table
-        table = ET.SubElement(parent, "table")
-        table.set("frame", "all")
-        table.set("rowsep", "1")
-        table.set("colsep", "1")
-        
-        # Table title
-        title = ET.SubElement(table, "title")
-        title.text = "Video Information"
-        
-        # Table group
-        tgroup = ET.SubElement(table, "tgroup")
-        tgroup.set("cols", "2")
-        
-        # Column specifications
-        colspec1 = ET.SubElement(tgroup, "colspec")
-        colspec1.set("colname", "property")
-        colspec1.set("colwidth", "1*")
-        
-        colspec2 = ET.SubElement(tgroup, "colspec")
-        colspec2.set("colname", "value")
-        colspec2.set("colwidth", "2*")
-        
-        # Table header
-        thead = ET.SubElement(tgroup, "thead")
-        header_row = ET.SubElement(thead, "row")
-        
-        header_entry1 = ET.SubElement(header_row, "entry")
-        header_entry1.text = "Property"
-        
-        header_entry2 = ET.SubElement(header_row, "entry")
-        header_entry2.text = "Value"
-        
-        # Table body
-        tbody = ET.SubElement(tgroup, "tbody")
-        
+        from lxml import etree as ET
+
         # Add metadata rows
         metadata_rows = [
             ("Duration", video_info.get('duration_formatted', 'Unknown')),
-            ("Resolution", f"{video_info.get('width', 0)}Ã—{video_info.get('height', 0)}"),
+            ("Resolution", f"{video_info.get('width', 0)}×{video_info.get('height', 0)}"),
             ("File Size", f"{video_info.get('file_size_mb', 0)} MB"),
             ("Format", video_info.get('format', 'Unknown')),
             ("Frame Rate", f"{video_info.get('fps', 0):.1f} fps" if video_info.get('fps') else 'Unknown'),
@@ -223,25 +215,26 @@ class VideoDitaBuilder:
         if video_info.get('audio_codec'):
             metadata_rows.append(("Audio Codec", video_info['audio_codec']))
         
-        for property_name, value in metadata_rows:
-            row = ET.SubElement(tbody, "row")
-            
-            entry1 = ET.SubElement(row, "entry")
-            entry1.text = property_name
-            
-            entry2 = ET.SubElement(row, "entry")
-            entry2.text = str(value)
+        # Let libxml2 build the whole table in one parse
+        rows = "".join(
+            f"<row><entry>{xml_escape(property_name)}</entry><entry>{xml_escape(str(value))}</entry></row>"
+            for property_name, value in metadata_rows
+        )
+        parent.append(ET.fromstring(_METADATA_TABLE_TEMPLATE.format(rows=rows)))
     
-    def _create_ditamap(self, topic_filename: str, video_info: Dict[str, Any]) -> ET.Element:
+    def _create_ditamap(self, topic_filename: str, video_info: Dict[str, Any], today: str) -> ET.Element:
         """Create DITAMAP element.
         
         Args:
             topic_filename: Name of the topic file
             video_info: Video metadata dictionary
+            today: Current date (YYYY-MM-DD) used for critdates
             
         Returns:
             DITAMAP root element
         """
+        from lxml import etree as ET
+
         # Create map element
         map_elem = ET.Element("map")
         try:
@@ -262,20 +255,17 @@ class VideoDitaBuilder:
         # Map-level topicmeta: ensure manual_reference and temporal metadata
         map_topicmeta = ET.SubElement(map_elem, "topicmeta")
         manual_ref = self._normalize_manual_reference(title.text)
-        other_manual_ref = ET.SubElement(map_topicmeta, "othermeta")
-        other_manual_ref.set("name", "manual_reference")
-        other_manual_ref.set("content", manual_ref)
+        ET.SubElement(map_topicmeta, "othermeta", attrib={"name": "manual_reference", "content": manual_ref})
         critdates = ET.SubElement(map_topicmeta, "critdates")
-        created = ET.SubElement(critdates, "created")
-        created.set("date", self._current_date_ymd())
-        revised = ET.SubElement(critdates, "revised")
-        revised.set("modified", self.metadata.get('revision_date') or self._current_date_ymd())
+        ET.SubElement(critdates, "created", attrib={"date": today})
+        ET.SubElement(critdates, "revised", attrib={"modified": self.metadata.get('revision_date') or today})
         
         # Add topic reference
-        topicref = ET.SubElement(map_elem, "topicref")
-        topicref.set("href", f"topics/{topic_filename}")
-        topicref.set("format", "dita")
-        topicref.set("type", "concept")
+        topicref = ET.SubElement(map_elem, "topicref", attrib={
+            "href": f"topics/{topic_filename}",
+            "format": "dita",
+            "type": "concept",
+        })
         # Provide explicit navtitle to help UIs display the expected label
         topicmeta = ET.SubElement(topicref, "topicmeta")
         navtitle = ET.SubElement(topicmeta, "navtitle")
@@ -293,29 +283,20 @@ class VideoDitaBuilder:
             Valid DITA topic ID
         """
         # Remove extension and clean filename
-        name_without_ext = Path(filename).stem
-        
-        # Replace invalid characters with hyphens
-        topic_id = ""
-        for char in name_without_ext.lower():
-            if char.isalnum():
-                topic_id += char
-            elif char in " -_.":
-                topic_id += "-"
+        name_without_ext = Path(filename).stem.lower()
         
-        # Remove duplicate hyphens
-        while "--" in topic_id:
-            topic_id = topic_id.replace("--", "-")
+        # Drop invalid characters and turn separator runs into single hyphens;
+        # edge hyphens are kept until the end so IDs match earlier releases
+        # (e.g. "_intro" -> "video--intro")
+        topic_id = _TOPIC_ID_INVALID.sub("", name_without_ext)
+        topic_id = _TOPIC_ID_SEPARATORS.sub("-", topic_id)
         
         # Ensure it starts with a letter
-        if not topic_id[0].isalpha():
+        if not topic_id or not topic_id[0].isalpha():
             topic_id = "video-" + topic_id
         
         # Limit length
-        if len(topic_id) > 50:
-            topic_id = topic_id[:50]
-        
-        return topic_id.strip("-")
+        return topic_id[:50].strip("-")
     
     def _get_video_media_filename(self, original_filename: str) -> str:
         """Get media filename for video file.
@@ -326,12 +307,27 @@ class VideoDitaBuilder:
         Returns:
             Media filename to use in DITA archive
         """
-        if self.config.get('dita_integration', {}).get('preserve_original_filenames', True):
+        if self._preserve_names:
             return original_filename
-        else:
-            # Generate sanitized filename
-            return self._generate_topic_id(original_filename) + Path(original_filename).suffix
+        # Generate sanitized filename
+        return self._generate_topic_id(original_filename) + Path(original_filename).suffix
     
+    def _read_video_bytes(self, video_path: Path) -> bytes:
+        """Read video content for the DITA context.
+
+        Used when ``stream_video_files`` is off, so the content is always
+        inlined as ``bytes`` whatever the file size; the read is sized up
+        front to avoid buffer regrowth on large files.
+
+        Args:
+            video_path: Path to source video file
+
+        Returns:
+            File content as ``bytes``
+        """
+        with open(video_path, 'rb') as f:
+            return f.read(os.fstat(f.fileno()).st_size)
+
     def _get_video_mime_type(self, extension: str) -> str:
         """Get MIME type for video extension.
         
@@ -341,18 +337,7 @@ class VideoDitaBuilder:
         Returns:
             MIME type string
         """
-        extension = extension.lower().lstrip('.')
-        
-        mime_types = {
-            'mp4': 'video/mp4',
-            'avi': 'video/x-msvideo',
-            'mov': 'video/quicktime',
-            'wmv': 'video/x-ms-wmv',
-            'webm': 'video/webm',
-            'mkv': 'video/x-matroska'
-        }
-        
-        return mime_types.get(extension, 'video/unknown')
+        return _MIME_TYPES.get(extension.lower().lstrip('.'), 'video/unknown')
     
     def format_xml_pretty(self, element: ET.Element) -> str:
         """Format XML element for pretty printing.
@@ -363,9 +348,9 @@ class VideoDitaBuilder:
         Returns:
             Pretty-formatted XML string
         """
-        rough_string = ET.tostring(element, encoding='unicode')
-        reparsed = xml.dom.minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+        from lxml import etree as ET
+
+        return ET.tostring(element, pretty_print=True, encoding='unicode')
 
     # --- Minimal helpers for required metadata defaults ---
     def _normalize_manual_reference(self, title: Optional[str]) -> str:
@@ -375,9 +360,8 @@ class VideoDitaBuilder:
         default = "VIDEO-LIBRARY"
         if not title:
             return default
-        norm = title.strip()
-        norm = re.sub(r"[^A-Za-z0-9]+", "-", norm)
-        norm = re.sub(r"-{2,}", "-", norm).strip("-")
+        norm = _MANUAL_REF_NONALNUM.sub("-", title.strip())
+        norm = _MANUAL_REF_DASHES.sub("-", norm).strip("-")
         return (norm.upper() or default)
 
     def _current_date_ymd(self) -> str:
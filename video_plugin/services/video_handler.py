@@ -8,13 +8,58 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional
 
 from orlando_toolkit.core.plugins.interfaces import DocumentHandlerBase, ProgressCallback
 from orlando_toolkit.core.models import DitaContext
 
 logger = logging.getLogger(__name__)
 
+# JSON schema for conversion metadata (shared, treat as read-only)
+_CONVERSION_METADATA_SCHEMA: Dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "title": "Video Conversion Settings",
+    "description": "Settings for video to DITA conversion",
+    "properties": {
+        "video_title": {
+            "type": "string",
+            "title": "Video Title",
+            "description": "Custom title for the video topic",
+            "default": ""
+        },
+        "include_metadata_table": {
+            "type": "boolean", 
+            "title": "Include Metadata Table",
+            "description": "Include technical video metadata in the topic",
+            "default": True
+        },
+        "generate_poster": {
+            "type": "boolean",
+            "title": "Generate Poster Image",
+            "description": "Generate a poster image from the video",
+            "default": True
+        },
+        "poster_time_percentage": {
+            "type": "number",
+            "title": "Poster Time (%)",
+            "description": "Time percentage for poster image generation",
+            "minimum": 0,
+            "maximum": 100,
+            "default": 10
+        },
+        "max_file_size_mb": {
+            "type": "integer",
+            "title": "Maximum File Size (MB)",
+            "description": "Maximum allowed video file size",
+            "minimum": 1,
+            "maximum": 2048,
+            "default": 500
+        }
+    },
+    "additionalProperties": False
+}
+
 
 class VideoDocumentHandler(DocumentHandlerBase):
     """Document handler for video files.
@@ -27,6 +72,7 @@ class VideoDocumentHandler(DocumentHandlerBase):
         """Initialize video document handler."""
         self._plugin_config: Dict[str, Any] = {}
         self._supported_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.webm', '.mkv']
+        self._supported_ext_set = frozenset(self._supported_extensions)
         
     def can_handle(self, file_path: Path) -> bool:
         """Check if file is a supported video format.
@@ -37,11 +83,13 @@ class VideoDocumentHandler(DocumentHandlerBase):
         Returns:
             True if file is a supported video format, False otherwise
         """
-        if not file_path or not file_path.exists():
+        if not file_path:
             return False
-            
-        extension = file_path.suffix.lower()
-        return extension in self._supported_extensions
+        
+        # Cheap extension test first so rejected files cost no syscall
+        if file_path.suffix.lower() not in self._supported_ext_set:
+            return False
+        return file_path.exists()
     
     def convert_to_dita(self, file_path: Path, metadata: Dict[str, Any], 
                        progress_callback: Optional[ProgressCallback] = None) -> DitaContext:
@@ -60,48 +108,36 @@ class VideoDocumentHandler(DocumentHandlerBase):
         """
         self.validate_file_exists(file_path)
         
-        logger.info(f"Starting video conversion: {file_path}")
+        logger.info("Starting video conversion: %s", file_path)
         
         # Import video processing components
         from .video_processor import VideoProcessor
         from .dita_builder import VideoDitaBuilder
         
         try:
-            # Step 1: Validate video file
+            # Step 1: Validate video file and extract metadata in one probe
+            # (full details: the context exports them as video_metadata)
             if progress_callback:
-                progress_callback("Validating video file...")
+                progress_callback("Reading video file...")
             
             processor = VideoProcessor(self._plugin_config)
-            if not processor.validate_format(file_path):
+            video_info = processor.probe(file_path)
+            if video_info is None:
                 raise ValueError(f"Unsupported or corrupted video file: {file_path}")
+            logger.debug("Extracted video metadata: %s", video_info)
             
-            # Step 2: Extract video metadata
-            if progress_callback:
-                progress_callback("Extracting video metadata...")
-            
-            video_info = processor.extract_metadata(file_path)
-            logger.debug(f"Extracted video metadata: {video_info}")
-            
-            # Step 3: Create DITA structure (no poster generation - KISS principle)
+            # Step 2: Create DITA structure (no poster generation - KISS principle)
             if progress_callback:
                 progress_callback("Creating DITA topics...")
             
             builder = VideoDitaBuilder(metadata, self._plugin_config)
             context = builder.create_dita_context(file_path, video_info, None)
-            # Ensure topic titles reflect the video name (without extension)
-            try:
-                from pathlib import Path as _P
-                for fname, topic_el in list(context.topics.items()):
-                    title_el = topic_el.find('title') if hasattr(topic_el, 'find') else None
-                    if title_el is not None:
-                        title_el.text = _P(video_info['filename']).stem
-            except Exception:
-                pass
+            self._apply_video_title(context, video_info)
             
             if progress_callback:
                 progress_callback("Video conversion completed")
             
-            logger.info(f"Successfully converted video: {file_path}")
+            logger.info("Successfully converted video: %s", file_path)
             return context
             
         except Exception as e:
@@ -111,6 +147,15 @@ class VideoDocumentHandler(DocumentHandlerBase):
                 progress_callback(f"Error: {str(e)}")
             raise Exception(error_msg) from e
     
+    @staticmethod
+    def _apply_video_title(context: DitaContext, video_info: Dict[str, Any]) -> None:
+        """Ensure topic titles reflect the video name (without extension)."""
+        stem = Path(video_info['filename']).stem
+        for topic_el in context.topics.values():
+            title_el = topic_el.find('title') if hasattr(topic_el, 'find') else None
+            if title_el is not None:
+                title_el.text = stem
+    
     def get_supported_extensions(self) -> List[str]:
         """Return list of supported video file extensions.
         
@@ -122,52 +167,12 @@ class VideoDocumentHandler(DocumentHandlerBase):
     def get_conversion_metadata_schema(self) -> Dict[str, Any]:
         """Return JSON schema for video conversion metadata.
         
+        The schema is a shared module-level constant; callers must not mutate it.
+        
         Returns:
             JSON schema dictionary for validation and UI generation
         """
-        return {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "title": "Video Conversion Settings",
-            "description": "Settings for video to DITA conversion",
-            "properties": {
-                "video_title": {
-                    "type": "string",
-                    "title": "Video Title",
-                    "description": "Custom title for the video topic",
-                    "default": ""
-                },
-                "include_metadata_table": {
-                    "type": "boolean", 
-                    "title": "Include Metadata Table",
-                    "description": "Include technical video metadata in the topic",
-                    "default": True
-                },
-                "generate_poster": {
-                    "type": "boolean",
-                    "title": "Generate Poster Image",
-                    "description": "Generate a poster image from the video",
-                    "default": True
-                },
-                "poster_time_percentage": {
-                    "type": "number",
-                    "title": "Poster Time (%)",
-                    "description": "Time percentage for poster image generation",
-                    "minimum": 0,
-                    "maximum": 100,
-                    "default": 10
-                },
-                "max_file_size_mb": {
-                    "type": "integer",
-                    "title": "Maximum File Size (MB)",
-                    "description": "Maximum allowed video file size",
-                    "minimum": 1,
-                    "maximum": 2048,
-                    "default": 500
-                }
-            },
-            "additionalProperties": False
-        }
+        return _CONVERSION_METADATA_SCHEMA
     
     def get_handler_info(self) -> Dict[str, Any]:
         """Get detailed information about this handler.
@@ -197,20 +202,24 @@ class VideoDocumentHandler(DocumentHandlerBase):
             'schema': self.get_conversion_metadata_schema()
         }
     
-    def validate_video_constraints(self, file_path: Path) -> None:
+    def validate_video_constraints(self, file_path: Path,
+                                   file_size: Optional[int] = None) -> None:
         """Validate video file against plugin constraints.
         
         Args:
             file_path: Path to video file
+            file_size: Size in bytes if already known (e.g. metadata['file_size'])
             
         Raises:
             ValueError: If file doesn't meet constraints
         """
         # Check file size
         max_size_mb = self._plugin_config.get('video_processing', {}).get('max_file_size_mb', 500)
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        if file_size is None:
+            file_size = file_path.stat().st_size
+        file_size_mb = file_size / (1024 * 1024)
         
         if file_size_mb > max_size_mb:
             raise ValueError(f"Video file too large: {file_size_mb:.1f}MB (max: {max_size_mb}MB)")
         
-        logger.debug(f"Video file size: {file_size_mb:.1f}MB (within {max_size_mb}MB limit)")
+        logger.debug("Video file size: %.1fMB (within %sMB limit)", file_size_mb, max_size_mb)
@@ -6,18 +6,136 @@ metadata extraction, format validation, and poster image generation.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import threading
+from collections import OrderedDict
+from math import gcd
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import ClassVar, Dict, Any, Optional, Tuple
 import tempfile
 import os
 
 logger = logging.getLogger(__name__)
 
+# Optional native backends, resolved once at import (None when not installed)
+try:
+    import av as _av
+except ImportError:
+    _av = None
+
+try:
+    import cv2 as _cv2
+except ImportError:
+    _cv2 = None
+
+# ISO-BMFF / QuickTime top-level atoms that may open an MP4/MOV file
+_QT_LEADING_ATOMS = (b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip', b'pnot')
+_EBML_MAGIC = b'\x1a\x45\xdf\xa3'  # Matroska / WebM
+_ASF_MAGIC = b'\x30\x26\xb2\x75\x8e\x66\xcf\x11'  # WMV / ASF
+
+# Static per-extension format descriptions returned by get_format_info
+_FORMAT_INFO: Dict[str, Dict[str, Any]] = {
+    '.mp4': {
+        'name': 'MP4',
+        'description': 'MPEG-4 Part 14',
+        'mime_type': 'video/mp4',
+        'common_codecs': ['H.264', 'H.265']
+    },
+    '.avi': {
+        'name': 'AVI', 
+        'description': 'Audio Video Interleave',
+        'mime_type': 'video/x-msvideo',
+        'common_codecs': ['MPEG-4', 'DivX', 'Xvid']
+    },
+    '.mov': {
+        'name': 'MOV',
+        'description': 'QuickTime Movie',
+        'mime_type': 'video/quicktime', 
+        'common_codecs': ['H.264', 'ProRes']
+    },
+    '.wmv': {
+        'name': 'WMV',
+        'description': 'Windows Media Video',
+        'mime_type': 'video/x-ms-wmv',
+        'common_codecs': ['WMV', 'VC-1']
+    },
+    '.webm': {
+        'name': 'WebM',
+        'description': 'WebM Video',
+        'mime_type': 'video/webm',
+        'common_codecs': ['VP8', 'VP9']
+    },
+    '.mkv': {
+        'name': 'MKV',
+        'description': 'Matroska Video',
+        'mime_type': 'video/x-matroska',
+        'common_codecs': ['H.264', 'H.265', 'VP9']
+    }
+}
+
+# Named aspect ratios matched within _ASPECT_RATIO_TOLERANCE
+_ASPECT_RATIOS = ((16 / 9, "16:9"), (4 / 3, "4:3"), (21 / 9, "21:9"), (1.0, "1:1"))
+_ASPECT_RATIO_TOLERANCE = 0.1
+
+# Maximum number of files kept in the extract_metadata LRU cache
+_METADATA_CACHE_SIZE = 256
+
+
+def _aspect_ratio_label(width: int, height: int) -> str:
+    """Return a display label such as "16:9" for the given frame size.
+    
+    Args:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        
+    Returns:
+        Named ratio when close to a common one, else the reduced "w:h" ratio
+    """
+    if width <= 0 or height <= 0:
+        return "Unknown"
+    ratio = width / height
+    for target, label in _ASPECT_RATIOS:
+        if abs(ratio - target) < _ASPECT_RATIO_TOLERANCE:
+            return label
+    divisor = gcd(width, height)
+    return f"{width // divisor}:{height // divisor}"
+
+
+def _sniff_container(path: Path) -> Optional[str]:
+    """Identify the container from the first bytes of a file.
+    
+    Args:
+        path: Path to candidate video file
+        
+    Returns:
+        Container name ('mp4', 'avi', 'matroska', 'asf') or None if unrecognised
+    """
+    try:
+        with path.open('rb') as f:
+            head = f.read(64)
+    except OSError:
+        return None
+    if head[4:8] in _QT_LEADING_ATOMS:
+        return 'mp4'
+    if head[:4] == b'RIFF' and head[8:12] == b'AVI ':
+        return 'avi'
+    if head[:4] == _EBML_MAGIC:
+        return 'matroska'
+    if head[:8] == _ASF_MAGIC:
+        return 'asf'
+    return None
+
 
 class VideoProcessor:
     """Core video processing functionality."""
     
+    # Extracted metadata shared across instances, keyed by
+    # (resolved path, mtime_ns, size, detailed) so edits invalidate entries
+    _METADATA_CACHE: ClassVar["OrderedDict[Tuple[str, int, int, bool], Dict[str, Any]]"] = OrderedDict()
+    _METADATA_CACHE_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, config: Dict[str, Any]) -> None:
         """Initialize video processor.
         
@@ -25,50 +143,88 @@ class VideoProcessor:
             config: Plugin configuration dictionary
         """
         self.config = config
-        self._logger = logging.getLogger(__name__)
     
     def validate_format(self, video_path: Path) -> bool:
         """Validate video format and codec compatibility.
         
+        PyAV only needs the container header to prove the file is demuxable,
+        so no frame is decoded; OpenCV is used as a fallback.
+        
         Args:
             video_path: Path to video file
             
         Returns:
             True if video format is supported and readable
         """
-        try:
-            import cv2
-            
-            # Try to open the video with OpenCV
-            cap = cv2.VideoCapture(str(video_path))
-            
-            if not cap.isOpened():
-                self._logger.error(f"Cannot open video file: {video_path}")
+        # Reject non-video files without loading any decoder
+        if _sniff_container(video_path) is None:
+            logger.error("Unrecognised video container: %s", video_path)
+            return False
+        
+        if _av is not None:
+            try:
+                with _av.open(str(video_path), metadata_errors='ignore') as container:
+                    if container.streams.video and container.streams.video[0].codec_context.name:
+                        logger.debug("Video format validation successful: %s", video_path)
+                        return True
+                logger.error("No video stream found: %s", video_path)
                 return False
-            
-            # Try to read first frame
-            ret, frame = cap.read()
-            cap.release()
+            except Exception as e:
+                logger.debug("PyAV validation failed, trying OpenCV: %s", e)
+        
+        if _cv2 is None:
+            logger.error("OpenCV not available for video validation")
+            return False
+        
+        try:
+            # read() already fails on a capture that did not open, and the
+            # handle is released on every path so batch runs cannot leak it
+            cap = _cv2.VideoCapture(str(video_path))
+            try:
+                ret, frame = cap.read()
+            finally:
+                cap.release()
             
             if not ret or frame is None:
-                self._logger.error(f"Cannot read video frames: {video_path}")
+                logger.error("Cannot open or read video frames: %s", video_path)
                 return False
             
-            self._logger.debug(f"Video format validation successful: {video_path}")
+            logger.debug("Video format validation successful: %s", video_path)
             return True
             
-        except ImportError:
-            self._logger.error("OpenCV not available for video validation")
-            return False
         except Exception as e:
-            self._logger.error(f"Video validation failed: {e}")
+            logger.error("Video validation failed: %s", e)
             return False
     
-    def extract_metadata(self, video_path: Path) -> Dict[str, Any]:
+    def probe(self, video_path: Path, *, detailed: bool = True) -> Optional[Dict[str, Any]]:
+        """Validate a video and extract its metadata in a single pass.
+        
+        Args:
+            video_path: Path to video file
+            detailed: Passed through to extract_metadata
+            
+        Returns:
+            Metadata dictionary, or None if the file is unsupported or unreadable
+        """
+        if _sniff_container(video_path) is None:
+            logger.error("Unrecognised video container: %s", video_path)
+            return None
+        try:
+            return self.extract_metadata(video_path, detailed=detailed)
+        except Exception as e:
+            logger.error("Video probe failed for %s: %s", video_path, e)
+            return None
+    
+    def extract_metadata(self, video_path: Path, *, detailed: bool = True) -> Dict[str, Any]:
         """Extract comprehensive video metadata.
         
+        PyAV reads everything from the container header in a single open;
+        OpenCV is only used when PyAV is unavailable or cannot demux the file.
+        
         Args:
             video_path: Path to video file
+            detailed: Also collect codec, bitrate, audio and container fields.
+                Callers needing only dimensions and duration can pass False.
             
         Returns:
             Dictionary containing video metadata
@@ -76,109 +232,181 @@ class VideoProcessor:
         Raises:
             Exception: If metadata extraction fails
         """
+        st = video_path.stat()
+        file_size = st.st_size
+        cache_key = (str(video_path.resolve()), st.st_mtime_ns, file_size, detailed)
+        with self._METADATA_CACHE_LOCK:
+            cached = self._METADATA_CACHE.get(cache_key)
+            if cached is not None:
+                self._METADATA_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            return copy.copy(cached)
+        
         metadata = {
             'filename': video_path.name,
-            'file_size': video_path.stat().st_size,
-            'file_size_mb': round(video_path.stat().st_size / (1024 * 1024), 2),
+            'file_size': file_size,
+            'file_size_mb': round(file_size / (1024 * 1024), 2),
         }
         
         try:
-            # Use OpenCV for basic properties
-            import cv2
-            cap = cv2.VideoCapture(str(video_path))
-            
-            if cap.isOpened():
-                metadata.update({
-                    'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                    'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                    'fps': cap.get(cv2.CAP_PROP_FPS),
-                    'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-                })
-                
-                # Calculate duration
-                if metadata['fps'] > 0:
-                    metadata['duration'] = metadata['frame_count'] / metadata['fps']
-                    metadata['duration_formatted'] = self._format_duration(metadata['duration'])
-                else:
-                    metadata['duration'] = 0
-                    metadata['duration_formatted'] = "Unknown"
-                
-                # Calculate aspect ratio
-                if metadata['height'] > 0:
-                    aspect_ratio = metadata['width'] / metadata['height']
-                    if abs(aspect_ratio - 16/9) < 0.1:
-                        metadata['aspect_ratio'] = "16:9"
-                    elif abs(aspect_ratio - 4/3) < 0.1:
-                        metadata['aspect_ratio'] = "4:3"
-                    else:
-                        metadata['aspect_ratio'] = f"{aspect_ratio:.2f}:1"
-                else:
-                    metadata['aspect_ratio'] = "Unknown"
-                
-                cap.release()
-                
-            # Try to get additional metadata with PyAV if available
-            try:
-                self._extract_detailed_metadata(video_path, metadata)
-            except Exception as e:
-                self._logger.warning(f"Could not extract detailed metadata: {e}")
-                
+            if not self._extract_with_av(video_path, metadata, detailed):
+                self._extract_with_cv2(video_path, metadata)
         except ImportError:
-            self._logger.error("OpenCV not available for metadata extraction")
+            logger.error("Neither PyAV nor OpenCV available for metadata extraction")
             raise Exception("Video processing library not available")
         except Exception as e:
-            self._logger.error(f"Metadata extraction failed: {e}")
+            logger.error("Metadata extraction failed: %s", e)
             raise Exception(f"Failed to extract video metadata: {str(e)}")
         
+        # Calculate duration
+        if metadata.get('duration', 0) > 0:
+            metadata['duration_formatted'] = self._format_duration(metadata['duration'])
+        else:
+            metadata['duration'] = 0
+            metadata['duration_formatted'] = "Unknown"
+        
+        # Calculate aspect ratio
+        metadata['aspect_ratio'] = _aspect_ratio_label(metadata['width'], metadata['height'])
+        
         # Add format information
         extension = video_path.suffix.lower()
         metadata['format'] = extension.lstrip('.')
         metadata['extension'] = extension
         
-        self._logger.info(f"Extracted metadata for {video_path.name}: "
-                         f"{metadata['width']}x{metadata['height']}, "
-                         f"{metadata['duration_formatted']}, "
-                         f"{metadata['file_size_mb']}MB")
+        logger.info("Extracted metadata for %s: %dx%d, %s, %sMB",
+                    video_path.name, metadata['width'], metadata['height'],
+                    metadata['duration_formatted'], metadata['file_size_mb'])
+        
+        with self._METADATA_CACHE_LOCK:
+            self._METADATA_CACHE[cache_key] = metadata
+            self._METADATA_CACHE.move_to_end(cache_key)
+            if len(self._METADATA_CACHE) > _METADATA_CACHE_SIZE:
+                self._METADATA_CACHE.popitem(last=False)
+        # Hand out a private copy so callers cannot mutate the cache
+        return copy.copy(metadata)
+    
+    async def extract_metadata_async(self, video_path: Path) -> Dict[str, Any]:
+        """Extract metadata without blocking the running event loop.
         
-        return metadata
+        Runs extract_metadata in a worker thread; several files can be
+        probed concurrently with ``asyncio.gather``.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Dictionary containing video metadata
+            
+        Raises:
+            Exception: If metadata extraction fails
+        """
+        # run_in_executor rather than asyncio.to_thread: Python 3.8 support
+        return await asyncio.get_running_loop().run_in_executor(None, self.extract_metadata, video_path)
     
-    def _extract_detailed_metadata(self, video_path: Path, metadata: Dict[str, Any]) -> None:
-        """Extract detailed metadata using PyAV if available.
+    def _extract_with_av(self, video_path: Path, metadata: Dict[str, Any],
+                         detailed: bool = True) -> bool:
+        """Fill basic and detailed metadata from the container header via PyAV.
         
         Args:
             video_path: Path to video file
             metadata: Metadata dictionary to update
+            detailed: Also read codec, bitrate, audio and container fields
+            
+        Returns:
+            True on success, False if PyAV is missing or cannot read the file
         """
+        if _av is None:
+            return False
+        
         try:
-            import av
+            with _av.open(str(video_path), metadata_errors='ignore') as container:
+                if not container.streams.video:
+                    return False
+                video_stream = container.streams.video[0]
+                fps = float(video_stream.average_rate) if video_stream.average_rate else 0.0
+                if container.duration:
+                    duration = container.duration / _av.time_base
+                elif video_stream.duration and video_stream.time_base:
+                    duration = float(video_stream.duration * video_stream.time_base)
+                else:
+                    duration = 0.0
+                metadata.update({
+                    'width': int(video_stream.codec_context.width or 0),
+                    'height': int(video_stream.codec_context.height or 0),
+                    'fps': fps,
+                    'frame_count': int(video_stream.frames or round(duration * fps)),
+                    'duration': duration,
+                })
+                if detailed:
+                    self._extract_detailed_metadata(container, metadata)
+            return True
+        except Exception as e:
+            logger.debug("PyAV metadata extraction failed, trying OpenCV: %s", e)
+            return False
+    
+    def _extract_with_cv2(self, video_path: Path, metadata: Dict[str, Any]) -> None:
+        """Fill basic metadata using OpenCV.
+        
+        Args:
+            video_path: Path to video file
+            metadata: Metadata dictionary to update
+            
+        Raises:
+            ImportError: If OpenCV is not installed
+            ValueError: If the file cannot be opened
+        """
+        if _cv2 is None:
+            raise ImportError("OpenCV not available")
+        cap = _cv2.VideoCapture(str(video_path))
+        try:
+            if not cap.isOpened():
+                raise ValueError(f"Cannot open video file: {video_path}")
+            # Decoding one frame is OpenCV's only proof the stream is readable
+            ret, frame = cap.read()
+            if not ret or frame is None:
+                raise ValueError(f"Cannot read video frames: {video_path}")
+            metadata.update({
+                'width': int(cap.get(_cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(cap.get(_cv2.CAP_PROP_FRAME_HEIGHT)),
+                'fps': cap.get(_cv2.CAP_PROP_FPS),
+                'frame_count': int(cap.get(_cv2.CAP_PROP_FRAME_COUNT)),
+            })
+            if metadata['fps'] > 0:
+                metadata['duration'] = metadata['frame_count'] / metadata['fps']
+        finally:
+            cap.release()
+    
+    def _extract_detailed_metadata(self, container: Any, metadata: Dict[str, Any]) -> None:
+        """Extract detailed metadata from an open PyAV container.
+        
+        Args:
+            container: Open PyAV input container
+            metadata: Metadata dictionary to update
+        """
+        try:
+            # Video stream information
+            if container.streams.video:
+                video_stream = container.streams.video[0]
+                metadata.update({
+                    'codec': video_stream.codec_context.name,
+                    'bitrate': video_stream.bit_rate or 0,
+                    'pixel_format': video_stream.codec_context.pix_fmt,
+                })
+            
+            # Audio stream information  
+            if container.streams.audio:
+                audio_stream = container.streams.audio[0]
+                metadata.update({
+                    'audio_codec': audio_stream.codec_context.name,
+                    'audio_channels': audio_stream.codec_context.channels,
+                    'audio_sample_rate': audio_stream.codec_context.sample_rate,
+                })
+            
+            # Container format
+            metadata['container_format'] = container.format.name
             
-            with av.open(str(video_path)) as container:
-                # Video stream information
-                if container.streams.video:
-                    video_stream = container.streams.video[0]
-                    metadata.update({
-                        'codec': video_stream.codec_context.name,
-                        'bitrate': video_stream.bit_rate or 0,
-                        'pixel_format': video_stream.codec_context.pix_fmt,
-                    })
-                
-                # Audio stream information  
-                if container.streams.audio:
-                    audio_stream = container.streams.audio[0]
-                    metadata.update({
-                        'audio_codec': audio_stream.codec_context.name,
-                        'audio_channels': audio_stream.codec_context.channels,
-                        'audio_sample_rate': audio_stream.codec_context.sample_rate,
-                    })
-                
-                # Container format
-                metadata['container_format'] = container.format.name
-                
-        except ImportError:
-            # PyAV not available, use basic metadata
-            pass
         except Exception as e:
-            self._logger.debug(f"Detailed metadata extraction failed: {e}")
+            logger.debug("Detailed metadata extraction failed: %s", e)
     
     # Poster generation intentionally omitted in first iteration (YAGNI)
     
@@ -191,12 +419,12 @@ class VideoProcessor:
         Returns:
             Formatted duration string (e.g., "1:23:45" or "5:30")
         """
-        if duration_seconds <= 0:
+        total = int(duration_seconds)
+        if total <= 0:
             return "0:00"
         
-        hours = int(duration_seconds // 3600)
-        minutes = int((duration_seconds % 3600) // 60)
-        seconds = int(duration_seconds % 60)
+        hours, remainder = divmod(total, 3600)
+        minutes, seconds = divmod(remainder, 60)
         
         if hours > 0:
             return f"{hours}:{minutes:02d}:{seconds:02d}"
@@ -206,6 +434,8 @@ class VideoProcessor:
     def get_format_info(self, video_path: Path) -> Dict[str, Any]:
         """Get format information for a video file.
         
+        Known formats return a shared entry that callers must not mutate.
+        
         Args:
             video_path: Path to video file
             
@@ -213,49 +443,12 @@ class VideoProcessor:
             Dictionary with format information
         """
         extension = video_path.suffix.lower()
-        
-        format_info = {
-            '.mp4': {
-                'name': 'MP4',
-                'description': 'MPEG-4 Part 14',
-                'mime_type': 'video/mp4',
-                'common_codecs': ['H.264', 'H.265']
-            },
-            '.avi': {
-                'name': 'AVI', 
-                'description': 'Audio Video Interleave',
-                'mime_type': 'video/x-msvideo',
-                'common_codecs': ['MPEG-4', 'DivX', 'Xvid']
-            },
-            '.mov': {
-                'name': 'MOV',
-                'description': 'QuickTime Movie',
-                'mime_type': 'video/quicktime', 
-                'common_codecs': ['H.264', 'ProRes']
-            },
-            '.wmv': {
-                'name': 'WMV',
-                'description': 'Windows Media Video',
-                'mime_type': 'video/x-ms-wmv',
-                'common_codecs': ['WMV', 'VC-1']
-            },
-            '.webm': {
-                'name': 'WebM',
-                'description': 'WebM Video',
-                'mime_type': 'video/webm',
-                'common_codecs': ['VP8', 'VP9']
-            },
-            '.mkv': {
-                'name': 'MKV',
-                'description': 'Matroska Video',
-                'mime_type': 'video/x-matroska',
-                'common_codecs': ['H.264', 'H.265', 'VP9']
-            }
-        }
-        
-        return format_info.get(extension, {
+        info = _FORMAT_INFO.get(extension)
+        if info is not None:
+            return info
+        return {
             'name': extension.upper().lstrip('.'),
             'description': f'{extension.upper().lstrip(".")} Video',
             'mime_type': 'video/unknown',
             'common_codecs': []
-        })
+        }
@@ -7,12 +7,14 @@ hierarchy mapping with a polished yet compact Tkinter UX. The launcher
 delegates actual conversion per file to the registered DocumentHandler.
 """
 
+import copy
 import threading
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, FrozenSet, Iterable, Iterator, Optional, Tuple
 from datetime import datetime, timezone
-import re
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -21,10 +23,87 @@ from lxml import etree as ET  # type: ignore
 
 from orlando_toolkit.core.models import DitaContext
 
+# Per-file map entry, cloned and filled in rather than built node by node
+_TOPICREF_TEMPLATE = ET.fromstring('<topicref href=""><topicmeta><navtitle/></topicmeta></topicref>')
+
+
+def _unique_name(name: str, used: Dict[str, Any], counters: Dict[str, int]) -> str:
+    """Return ``name`` or the first free ``base-N.ext`` variant not in ``used``.
+
+    ``counters`` remembers the next suffix to try per colliding name, so
+    repeated collisions do not re-probe every earlier variant.
+    """
+    if name not in used:
+        return name
+    base, ext = os.path.splitext(name)
+    i = counters.get(name, 2)
+    new = f"{base}-{i}{ext}"
+    while new in used:
+        i += 1
+        new = f"{base}-{i}{ext}"
+    counters[name] = i + 1
+    return new
+
+
+def _merge_unique(dst: Dict[str, Any], src: Dict[str, Any], counters: Dict[str, int]) -> Dict[str, str]:
+    """Merge ``src`` into ``dst``, renaming colliding keys via _unique_name.
+
+    Returns ``{original: renamed}`` for the keys that had to be renamed.
+    """
+    if not src.keys() & dst.keys():
+        # Usual case: no collisions, one C-level merge
+        dst.update(src)
+        return {}
+    renamed: Dict[str, str] = {}
+    for name, value in src.items():
+        safe_name = _unique_name(name, dst, counters)
+        dst[safe_name] = value
+        if safe_name != name:
+            renamed[name] = safe_name
+    return renamed
+
+
+def _iter_video_files(root: Path, exts: FrozenSet[str]) -> Iterator[Tuple[Path, str]]:
+    """Yield ``(file, rel_key)`` for files under ``root`` whose lowercased
+    extension is in ``exts``.
+
+    ``rel_key`` is the containing folder relative to ``root`` joined with
+    '/' ('' at the top level), accumulated from directory names as the walk
+    descends. Visits directories in the same top-down order as os.walk,
+    using os.scandir and only building a Path for matches. Symlinked
+    directories are not followed; unreadable directories are skipped.
+    """
+    # str.endswith matches every extension in one C call
+    suffixes = tuple(exts)
+    pending = deque([(os.fspath(root), '')])
+    while pending:
+        dir_path, rel_key = pending.pop()
+        subdirs: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, f"{rel_key}/{name}" if rel_key else name))
+                            continue
+                    except OSError:
+                        continue
+                    lowered = name.lower()
+                    # A bare '.mp4' is a dotfile without extension, as for Path.suffix
+                    if lowered.endswith(suffixes) and lowered not in exts:
+                        yield Path(entry.path), rel_key
+        except OSError:
+            continue
+        # Stack the children reversed so they are visited in listing order
+        pending.extend(reversed(subdirs))
+
 
 class VideoWorkflowLauncher:
     def __init__(self, plugin: Any) -> None:
         self._plugin = plugin
+        # Supported extensions keyed by (plugin_id, id(plugin_manager))
+        self._ext_cache: Dict[Tuple[str, int], FrozenSet[str]] = {}
 
     # Optional interface metadata
     def get_display_name(self) -> str:
@@ -40,7 +119,6 @@ class VideoWorkflowLauncher:
         top = tk.Toplevel(root)
         top.title("Video Library Workflow")
         top.transient(root)
-        top.grab_set()
         top.resizable(False, False)
         
         # Set window icon if available
@@ -87,26 +165,9 @@ class VideoWorkflowLauncher:
         ttk.Label(tip_frame, text="Folder selection preserves hierarchy as DITA sections",
                   foreground="#666", font=("Segoe UI", 9)).pack(side="left")
 
-        # Center window on parent
-        top.update_idletasks()  # Ensure window size is calculated
-        width = top.winfo_reqwidth()
-        height = top.winfo_reqheight()
-        
-        # Get parent window position and size
-        parent_x = root.winfo_rootx()
-        parent_y = root.winfo_rooty()
-        parent_width = root.winfo_width()
-        parent_height = root.winfo_height()
-        
-        # Calculate center position
-        x = parent_x + (parent_width // 2) - (width // 2)
-        y = parent_y + (parent_height // 2) - (height // 2)
-        
-        # Ensure window stays on screen
-        x = max(0, min(x, root.winfo_screenwidth() - width))
-        y = max(0, min(y, root.winfo_screenheight() - height))
-        
-        top.geometry(f"{width}x{height}+{x}+{y}")
+        # Center on parent (Tk clamps to the screen), then grab once placed
+        top.tk.call('tk::PlaceWindow', str(top), 'widget', str(root))
+        top.grab_set()
         
         # Keyboard shortcuts and focus
         top.bind("<Escape>", lambda e: top.destroy())
@@ -122,7 +183,7 @@ class VideoWorkflowLauncher:
         try:
             formats = self._get_supported_extensions_for_plugin(app_context, self._plugin.plugin_id)
             if formats:
-                pattern = " ".join(f"*{ext}" for ext in formats)
+                pattern = " ".join(f"*{ext}" for ext in sorted(formats))
                 filetypes = [("Supported Videos", pattern), ("All files", "*.*")]
             else:
                 filetypes = [("All files", "*.*")]
@@ -135,7 +196,8 @@ class VideoWorkflowLauncher:
         )
         if not paths:
             return
-        files = [Path(p) for p in paths]
+        # Picked files are placed at the map root
+        files = [(Path(p), '') for p in paths]
         self._run_batch_conversion(app_context, app_ui, files, root_folder=None)
 
     # ---------- Folder flow ----------
@@ -143,22 +205,13 @@ class VideoWorkflowLauncher:
         folder = filedialog.askdirectory(title="Select videos folder")
         if not folder:
             return
-        root = Path(folder)
-        exts = set(self._get_supported_extensions_for_plugin(app_context, self._plugin.plugin_id))
-        files: List[Path] = []
-        for dirpath, _dirnames, filenames in os.walk(root):
-            for name in filenames:
-                p = Path(dirpath) / name
-                if p.suffix.lower() in exts:
-                    files.append(p)
-        if not files:
-            messagebox.showinfo("No videos found", "No supported video files were found in the selected folder.")
-            return
-        self._run_batch_conversion(app_context, app_ui, files, root_folder=root)
+        # Enumerate on the worker thread so the spinner shows immediately
+        self._run_batch_conversion(app_context, app_ui, None, root_folder=Path(folder))
 
     # ---------- Batch conversion ----------
     def _run_batch_conversion(self, app_context: Any, app_ui: Any,
-                              files: List[Path], root_folder: Optional[Path]) -> None:
+                              files: Optional[List[Tuple[Path, str]]], root_folder: Optional[Path]) -> None:
+        """Convert ``(file, rel_key)`` pairs in a worker thread; ``files=None`` scans ``root_folder`` there."""
         # Progress UI
         try:
             if getattr(app_ui, 'status_label', None):
@@ -168,26 +221,103 @@ class VideoWorkflowLauncher:
         except Exception:
             pass
 
-        # Threaded conversion to keep UI responsive
+        # Escape cancels the batch; the host's own binding is restored afterwards
+        cancel_evt = threading.Event()
+        prev_escape = None
+        try:
+            prev_escape = app_ui.root.bind("<Escape>")
+            app_ui.root.bind("<Escape>", lambda e: cancel_evt.set())
+        except Exception:
+            pass
+
+        def _restore_escape():
+            try:
+                if prev_escape:
+                    app_ui.root.bind("<Escape>", prev_escape)
+                else:
+                    app_ui.root.unbind("<Escape>")
+            except Exception:
+                pass
+
+        def _restore_ui():
+            _restore_escape()
+            try:
+                app_ui._hide_loading_spinner()
+                app_ui._enable_all_ui_elements()
+            except Exception:
+                pass
+
+        def _succeed(ctx):
+            _restore_escape()
+            app_ui.on_conversion_success(ctx)
+
+        # Progress goes through a private host method; skip it when absent
+        show_spinner = getattr(app_ui, '_show_loading_spinner', None)
+
+        def _progress(done: int, total: int, f: Path) -> None:
+            if show_spinner is None:
+                return
+            try:
+                app_ui.root.after(0, show_spinner, "Converting Videos",
+                                  f"{done}/{total}: {f.name} (Esc to cancel)")
+            except Exception:
+                pass
+
+        def _no_videos():
+            _restore_ui()
+            messagebox.showinfo("No videos found", "No supported video files were found in the selected folder.")
+
+        def _cancelled():
+            # The partial result is discarded; nothing is opened
+            _restore_ui()
+            messagebox.showinfo("Conversion cancelled", "Video conversion was cancelled. No project was opened.")
+
+        def _nothing_converted():
+            _restore_ui()
+            messagebox.showinfo("No videos converted", "None of the selected files could be converted.")
+
+        # Threaded enumeration and conversion to keep UI responsive
         def work():
             try:
-                ctx = self._convert_many(app_context, files, root_folder)
+                batch = files
+                if batch is None:
+                    exts = self._get_supported_extensions_for_plugin(app_context, self._plugin.plugin_id)
+                    batch = list(_iter_video_files(root_folder, exts))
+                    if not batch:
+                        app_ui.root.after(0, _no_videos)
+                        return
+                ctx = self._convert_many(app_context, batch, _progress, cancel_evt)
+                if cancel_evt.is_set():
+                    app_ui.root.after(0, _cancelled)
+                    return
+                if not ctx.topics:
+                    # Never open an empty project
+                    app_ui.root.after(0, _nothing_converted)
+                    return
                 # Hand off to the host app on the UI thread
-                app_ui.root.after(0, app_ui.on_conversion_success, ctx)
+                app_ui.root.after(0, _succeed, ctx)
             except Exception as e:
                 def _fail():
-                    try:
-                        app_ui._hide_loading_spinner()
-                        app_ui._enable_all_ui_elements()
-                    except Exception:
-                        pass
+                    _restore_ui()
                     messagebox.showerror("Conversion Error", str(e))
                 app_ui.root.after(0, _fail)
 
         threading.Thread(target=work, daemon=True).start()
 
     # ---------- Core helpers ----------
-    def _get_supported_extensions_for_plugin(self, app_context: Any, plugin_id: str) -> List[str]:
+    def _get_supported_extensions_for_plugin(self, app_context: Any, plugin_id: str) -> FrozenSet[str]:
+        """Return the lowercased extensions the plugin handles (memoized per plugin manager)."""
+        key = (plugin_id, id(getattr(app_context, 'plugin_manager', None)))
+        cached = self._ext_cache.get(key)
+        if cached is not None:
+            return cached
+        exts = self._lookup_supported_extensions(app_context, plugin_id)
+        # Only remember successful lookups so a transient failure is retried
+        if exts:
+            self._ext_cache[key] = exts
+        return exts
+
+    def _lookup_supported_extensions(self, app_context: Any, plugin_id: str) -> FrozenSet[str]:
         try:
             formats = app_context.plugin_manager.get_plugin_metadata(plugin_id).supported_formats or []
             exts = [f.get('extension') for f in formats if isinstance(f, dict) and f.get('extension')]
@@ -200,11 +330,19 @@ class VideoWorkflowLauncher:
                             exts.extend(h.get_supported_extensions())
                         except Exception:
                             pass
-            return sorted({e.lower() for e in exts if e})
+            return frozenset(e.lower() for e in exts if e)
         except Exception:
-            return []
+            return frozenset()
+
+    def _convert_many(self, app_context: Any, files: List[Tuple[Path, str]],
+                      on_progress: Optional[Callable[[int, int, Path], None]] = None,
+                      cancel_evt: Optional[threading.Event] = None) -> DitaContext:
+        """Convert and merge files into one context.
 
-    def _convert_many(self, app_context: Any, files: List[Path], root_folder: Optional[Path]) -> DitaContext:
+        ``on_progress(done, total, file)`` is called after each merged file.
+        Setting ``cancel_evt`` stops the batch early; the partial context is
+        returned but callers should discard it.
+        """
         # Build a fresh combined context
         combined = DitaContext()
         # Prefill UI fields: Manual Title and Revision Date
@@ -237,12 +375,6 @@ class VideoWorkflowLauncher:
             pass
         combined.ditamap_root = map_el
 
-        # Ensure map-level topicmeta with manual_reference and temporal metadata
-        def _norm_manual_ref(title: str) -> str:
-            t = (title or "VIDEO-LIBRARY").strip()
-            t = re.sub(r"[^A-Za-z0-9]+", "-", t)
-            t = re.sub(r"-{2,}", "-", t).strip("-")
-            return t.upper() or "VIDEO-LIBRARY"
         # Map-level topicmeta (manual_reference/manualCode/critdates) now enforced in core save
 
         # Build a folder node cache: rel_dir (str) -> topichead element
@@ -251,64 +383,39 @@ class VideoWorkflowLauncher:
         # Decide handler lookup strategy: reuse first compatible handler
         service_registry = app_context.service_registry
 
-        # Track collisions
-        def _dedup_name(name: str, used: Dict[str, Any]) -> str:
-            if name not in used:
-                return name
-            base, ext = os.path.splitext(name)
-            i = 2
-            new = f"{base}-{i}{ext}"
-            while new in used:
-                i += 1
-                new = f"{base}-{i}{ext}"
-            return new
-
-        for f in files:
-            handler = service_registry.find_handler_for_file(f)
-            if handler is None:
-                # Skip unsupported file silently to keep flow resilient
-                continue
-            # Minimal metadata; host’s prepare_package will finalize naming
-            md = {
-                "manual_title": combined.metadata.get("manual_title", "Videos"),
-            }
-            ctx = handler.convert_to_dita(f, md)
+        # Track collisions: next de-duplication suffix per name and namespace
+        topic_counters: Dict[str, int] = {}
+        image_counters: Dict[str, int] = {}
+        video_counters: Dict[str, int] = {}
+        info_counters: Dict[str, int] = {}
+        # Per-video metadata merged for panel tooltips, resolved once per batch
+        dst_info_map = combined.plugin_data.setdefault('orlando-video-plugin', {}).setdefault('video_info_map', {})
+
+        # Minimal metadata; host’s prepare_package will finalize naming
+        md = {
+            "manual_title": combined.metadata.get("manual_title", "Videos"),
+        }
+        done = 0
+        for f, rel_key, ctx in self._convert_concurrently(service_registry, files, md, cancel_evt):
 
             # Merge topics
-            rename_map: Dict[str, str] = {}
-            for tname, topic_el in ctx.topics.items():
-                safe_name = _dedup_name(tname, combined.topics)
-                combined.topics[safe_name] = topic_el
-                if safe_name != tname:
-                    rename_map[tname] = safe_name
+            rename_map = _merge_unique(combined.topics, ctx.topics, topic_counters)
 
             # Merge media (images/videos) if any
-            for iname, blob in ctx.images.items():
-                s = _dedup_name(iname, combined.images)
-                combined.images[s] = blob
-            for vname, blob in ctx.videos.items():
-                s = _dedup_name(vname, combined.videos)
-                combined.videos[s] = blob
+            _merge_unique(combined.images, ctx.images, image_counters)
+            _merge_unique(combined.videos, ctx.videos, video_counters)
 
             # Merge per-video metadata for panel tooltips
-            try:
-                src_map = ((ctx.plugin_data or {}).get('orlando-video-plugin', {}).get('video_info_map', {}))
-                if src_map:
-                    dst = combined.plugin_data.setdefault('orlando-video-plugin', {}).setdefault('video_info_map', {})
-                    for k, v in src_map.items():
-                        key = _dedup_name(k, dst)
-                        dst[key] = v
-            except Exception:
-                pass
+            src_map = (ctx.plugin_data or {}).get('orlando-video-plugin', {}).get('video_info_map', {})
+            _merge_unique(dst_info_map, src_map, info_counters)
 
             # Determine the topic filename referenced by the child map
             # The child context typically has a single root topicref -> topics/<filename>
             href = None
             child_map = ctx.ditamap_root
             if child_map is not None:
-                tref = child_map.find('.//topicref[@href]')
-                if tref is not None:
-                    href = tref.get('href')
+                # Plain iteration avoids compiling an ElementPath per file
+                href = next((el.get('href') for el in child_map.iter('topicref') if el.get('href')), None)
             # Fallback: best-effort pick first topic filename
             if not href and ctx.topics:
                 href = f"topics/{next(iter(ctx.topics.keys()))}"
@@ -316,44 +423,84 @@ class VideoWorkflowLauncher:
             # Place topicref under proper folder head
             if href:
                 parent = map_el
-                if root_folder is not None:
-                    rel = f.relative_to(root_folder).parent
-                    rel_key = str(rel).replace(os.sep, '/') if str(rel) != '.' else ''
-                    if rel_key:
-                        parent = self._ensure_folder_nodes(map_el, folder_nodes, rel_key)
-                # Append topicref
-                tref = ET.SubElement(parent, "topicref")
-                # Adjust href if the topic filename was de-duplicated
-                try:
-                    base = os.path.basename(href)
-                    new_base = rename_map.get(base, base)
-                    tref.set("href", f"topics/{new_base}")
-                    # Provide navtitle so the UI shows the video name, not a generic label
-                    topicmeta = ET.SubElement(tref, "topicmeta")
-                    nav = ET.SubElement(topicmeta, "navtitle")
-                    nav.text = f.stem
-                except Exception:
-                    tref.set("href", href)
+                if rel_key:
+                    parent = self._ensure_folder_nodes(map_el, folder_nodes, rel_key)
+                # Append topicref; adjust href if the topic filename was de-duplicated
+                # hrefs are URI references, so '/' is the only separator
+                base = href[href.rfind('/') + 1:]
+                new_base = rename_map.get(base, base)
+                tref = copy.deepcopy(_TOPICREF_TEMPLATE)
+                tref.set("href", f"topics/{new_base}")
+                # Provide navtitle so the UI shows the video name, not a generic label
+                tref[0][0].text = f.stem
+                parent.append(tref)
+
+            done += 1
+            if on_progress is not None:
+                on_progress(done, len(files), f)
 
         return combined
 
+    def _convert_concurrently(self, service_registry: Any, files: Iterable[Tuple[Path, str]],
+                              md: Dict[str, Any], cancel_evt: Optional[threading.Event] = None
+                              ) -> Iterator[Tuple[Path, str, DitaContext]]:
+        """Convert files on a thread pool, yielding ``(file, rel_key, ctx)`` in input order.
+
+        Files without a handler are skipped silently to keep the flow resilient.
+        Results are merged by the caller while later files are still converting.
+        Once ``cancel_evt`` is set no further results are yielded.
+        """
+        pool = ThreadPoolExecutor(max_workers=self._batch_worker_count(),
+                                  thread_name_prefix="video-convert")
+        jobs = []
+        try:
+            # Handlers match on extension, so look each suffix up only once
+            handler_cache: Dict[str, Any] = {}
+            for f, rel_key in files:
+                suffix = f.suffix.lower()
+                if suffix in handler_cache:
+                    handler = handler_cache[suffix]
+                else:
+                    handler = handler_cache[suffix] = service_registry.find_handler_for_file(f)
+                if handler is None:
+                    continue
+                jobs.append((f, rel_key, pool.submit(handler.convert_to_dita, f, dict(md))))
+            for f, rel_key, future in jobs:
+                if cancel_evt is not None and cancel_evt.is_set():
+                    break
+                yield f, rel_key, future.result()
+        finally:
+            # On failure or cancellation drop conversions that have not started
+            # yet (cancelled by hand: shutdown(cancel_futures=) needs Python 3.9)
+            for _f, _rel_key, future in jobs:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _batch_worker_count(self) -> int:
+        """Thread count for batch conversion (video_processing.batch_workers, 0 = auto)."""
+        try:
+            config = getattr(self._plugin, 'config', None) or {}
+            workers = int(config.get('video_processing', {}).get('batch_workers', 0) or 0)
+        except Exception:
+            workers = 0
+        if workers > 0:
+            return workers
+        return min(8, os.cpu_count() or 4)
+
     def _ensure_folder_nodes(self, map_el: ET.Element, cache: Dict[str, ET.Element], rel_key: str) -> ET.Element:
         """Ensure nested topichead nodes exist for the given rel path (a/b/c)."""
-        if rel_key in cache:
-            return cache[rel_key]
-        parts = [p for p in rel_key.split('/') if p]
-        path_accum = []
-        parent = map_el
-        for part in parts:
-            path_accum.append(part)
-            key = "/".join(path_accum)
-            if key in cache:
-                parent = cache[key]
-                continue
-            head = ET.SubElement(parent, "topichead")
-            meta = ET.SubElement(head, "topicmeta")
-            nav = ET.SubElement(meta, "navtitle")
-            nav.text = part
-            cache[key] = head
-            parent = head
-        return parent
+        head = cache.get(rel_key)
+        if head is not None:
+            return head
+        # Resolve the parent first; each ancestor is then a single cache hit
+        if '/' in rel_key:
+            parent_key, leaf = rel_key.rsplit('/', 1)
+            parent = self._ensure_folder_nodes(map_el, cache, parent_key)
+        else:
+            parent, leaf = map_el, rel_key
+        head = ET.SubElement(parent, "topichead")
+        meta = ET.SubElement(head, "topicmeta")
+        nav = ET.SubElement(meta, "navtitle")
+        nav.text = leaf
+        cache[rel_key] = head
+        return head
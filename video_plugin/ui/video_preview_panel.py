@@ -7,13 +7,16 @@ Advanced features and fallbacks are intentionally omitted.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import queue
 import sys
 import tempfile
-from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 
 import tkinter as tk
 from tkinter import ttk
@@ -21,6 +24,34 @@ from lxml import etree as ET
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; re-evaluated on every topic switch
+_XP_VIDEO = ET.XPath('.//video')
+_XP_OBJECT_VIDEO = ET.XPath('.//object[contains(@outputclass, "video")]')
+_SPEED_RE = re.compile(r"\d+(?:[\.,]\d+)?")
+# Temp files kept per panel; least recently selected ones are deleted first
+_MAX_TEMP_FILES = 8
+# Interval of the Tk-side loop applying queued libVLC events. It only pops
+# a Python queue (no libVLC calls); 200 ms matches the old poll rate and
+# libVLC's own TimeChanged cadence (~250 ms)
+_TIMELINE_INTERVAL_MS = 200
+
+
+def _split_href(href: str) -> Tuple[str, str]:
+    """Return ``(name, stem)`` of a media href using plain string splits."""
+    name = href.rpartition('/')[2]
+    stem = name.rpartition('.')[0] or name
+    return name, stem
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_seconds(s: int) -> str:
+    """Return ``HH:MM:SS`` (or ``MM:SS`` under an hour) for whole seconds."""
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
+    if h:
+        return f"{h:02d}:{m:02d}:{s:02d}"
+    return f"{m:02d}:{s:02d}"
+
 
 class VideoPreviewPanel(ttk.Frame):
     """Minimal VLC-backed video preview panel."""
@@ -29,6 +60,15 @@ class VideoPreviewPanel(ttk.Frame):
     PAUSE_ICON = "\u23F8"  # ⏸
     STOP_ICON = "\u23F9"   # ⏹
 
+    # python-vlc module and libVLC instance, loaded on first use and shared by
+    # all panels (creating an Instance rescans libVLC's plugins)
+    _vlc_mod: ClassVar[Any] = None
+    _vlc_unavailable: ClassVar[bool] = False
+    _shared_instance: ClassVar[Any] = None
+
+    # Writes media blobs to temp files off the Tk thread (shared by all panels)
+    _io_pool: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otk-vlc-io")
+
     def __init__(self, parent: tk.Widget, *, plugin_config: Dict[str, Any] = None, app_context: Optional[Any] = None, **kwargs) -> None:
         super().__init__(parent, **kwargs)
         self.plugin_config = plugin_config or {}
@@ -37,23 +77,49 @@ class VideoPreviewPanel(ttk.Frame):
         # State
         self._topic: Optional[ET.Element] = None
         self._context: Optional[Any] = None
-        self._videos: Dict[str, bytes] = {}
-        self._items: List[Dict[str, Any]] = []  # [{'display': str, 'filename': str, 'href': str}]
+        self._videos: Dict[str, Any] = {}  # bytes-like blobs or source paths
+        # [{'display': str, 'filename': str (key into self._videos), 'href': str}]
+        self._items: List[Dict[str, Any]] = []
 
         # Temp files
         self._temp_dir = tempfile.mkdtemp(prefix="otk_vlc_")
-        self._temp_paths: Dict[str, str] = {}
+        self._temp_paths: OrderedDict[str, str] = OrderedDict()
+        self._pending_writes: Set[str] = set()
 
         # VLC
         self._vlc_instance = None
+        # Player embedded in the surface, created once and reused per clip;
+        # _vlc_player refers to it only while a clip is loaded
+        self._embedded_player = None
         self._vlc_player = None
-        # Controls/polling state
-        self._poll_job = None
+        # Media waiting for the surface to be mapped (opened from <Map>)
+        self._pending_open_path: Optional[str] = None
+        # libVLC events, filled on libVLC's thread and drained on the Tk
+        # thread (the callbacks must never call into Tk themselves)
+        self._events: queue.Queue = queue.Queue()
+        self._timeline_job: Optional[str] = None
+        # Playing state as last reported by libVLC events; keeps the loop alive
+        self._playing = False
+        # Bumped per loaded clip; events tagged with an older value are stale
+        self._load_gen = 0
+        # Controls/playback state
         self._user_seeking = False
         self._updating_seek = False
+        # Drag seeks are coalesced: latest target and its scheduled apply
+        self._pending_seek_ms: Optional[int] = None
+        self._seek_apply_job: Optional[str] = None
+        # Volume drags are debounced the same way
+        self._pending_vol: Optional[int] = None
+        self._vol_job: Optional[str] = None
         self._current_filename: Optional[str] = None
         self._last_pos_ms_by_file: Dict[str, int] = {}
         self._duration_ms: int = 0
+        self._last_displayed_sec = -1
+        # Last values pushed to the widgets, to skip no-op redraws
+        self._last_seek_val = -1
+        self._last_time_text: Optional[str] = None
+        # At most one label refresh queued per event-loop iteration
+        self._label_update_job: Optional[str] = None
 
         # UI
         self._status = tk.StringVar(value="")
@@ -76,8 +142,9 @@ class VideoPreviewPanel(ttk.Frame):
         list_frame.columnconfigure(0, weight=1)
         self._list = tk.Listbox(list_frame, height=5, exportselection=False)
         self._list.grid(row=0, column=0, sticky="ew")
-        ttk.Scrollbar(list_frame, orient="vertical", command=self._list.yview).grid(row=0, column=1, sticky="ns")
-        self._list.configure(yscrollcommand=lambda *a: None)
+        sb = ttk.Scrollbar(list_frame, orient="vertical", command=self._list.yview)
+        sb.grid(row=0, column=1, sticky="ns")
+        self._list.configure(yscrollcommand=sb.set)
         self._list.bind("<<ListboxSelect>>", self._on_select)
 
         self._surface = ttk.Frame(self)
@@ -132,7 +199,7 @@ class VideoPreviewPanel(ttk.Frame):
         self._populate_items()
 
     def clear_data(self) -> None:
-        self._close_vlc()
+        self._stop_media()
         self._topic = None
         self._context = None
         self._videos = {}
@@ -142,7 +209,7 @@ class VideoPreviewPanel(ttk.Frame):
         self._placeholder.configure(text="Select a video to play")
 
     def cleanup(self) -> None:
-        self._close_vlc()
+        self._release_player()
         try:
             for p in list(self._temp_paths.values()):
                 try:
@@ -168,7 +235,7 @@ class VideoPreviewPanel(ttk.Frame):
 
     # Internals ---------------------------------------------------------------
     def _populate_items(self) -> None:
-        self._close_vlc()
+        self._stop_media()
         self._items.clear()
         self._list.delete(0, tk.END)
 
@@ -179,8 +246,8 @@ class VideoPreviewPanel(ttk.Frame):
                 # Collect both legacy <video> and new <object> forms
                 used_xpath = False
                 try:
-                    vids.extend(self._topic.xpath('.//video'))
-                    vids.extend(self._topic.xpath('.//object[contains(@outputclass, "video")]'))
+                    vids.extend(_XP_VIDEO(self._topic))
+                    vids.extend(_XP_OBJECT_VIDEO(self._topic))
                     used_xpath = True
                 except Exception:
                     # Fallback for stdlib xml.etree without XPath support
@@ -218,18 +285,23 @@ class VideoPreviewPanel(ttk.Frame):
             else:
                 # object: normalize to media/<name>
                 data = str(v.get('data', '') or v.get('href', '') or '')
-                name_only = Path(data).name if data else ''
+                name_only = _split_href(data)[0] if data else ''
                 if name_only:
                     href = f'media/{name_only}'
             if href:
-                name = Path(href).name
-                self._items.append({'display': Path(name).stem, 'filename': name, 'href': href})
+                filename = self._strip_media(href)
+                # Skip references whose media is not in the context
+                if filename not in self._videos:
+                    continue
+                stem = _split_href(href)[1]
+                self._items.append({'display': stem, 'filename': filename, 'href': href})
 
         # Strict scoping: do not show context-wide videos when topic has none
         # Leave the list empty to reflect the selected topic accurately
 
-        for item in self._items:
-            self._list.insert(tk.END, item['display'])
+        # One bulk insert instead of a Listbox update per row
+        if self._items:
+            self._list.insert(tk.END, *[item['display'] for item in self._items])
 
         if self._items:
             self._list.selection_set(0)
@@ -242,7 +314,7 @@ class VideoPreviewPanel(ttk.Frame):
         if not sel:
             return
         item = self._items[int(sel[0])]
-        filename = self._strip_media(item['href'])
+        filename = item['filename']
         data = self._videos.get(filename)
         # Update compact tooltip/status with metadata if available
         try:
@@ -280,103 +352,222 @@ class VideoPreviewPanel(ttk.Frame):
         if not data:
             self._status.set("Media not found in context")
             return
-        self._status.set("Loadingâ€¦")
+        self._status.set("Loading…")
+        if isinstance(data, os.PathLike):
+            # Path-backed entry: play the source file directly
+            self._open_vlc(os.fspath(data))
+            return
         path = self._temp_paths.get(filename)
-        if not path:
-            path = os.path.join(self._temp_dir, filename)
-            try:
-                with open(path, 'wb') as f:
-                    f.write(data)
+        if path:
+            self._temp_paths.move_to_end(filename)
+            self._open_vlc(path)
+            return
+        # First selection: write the blob in the background, open once done
+        self._stop_media()
+        if filename in self._pending_writes:
+            return
+        self._pending_writes.add(filename)
+        path = os.path.join(self._temp_dir, filename)
+        future = self._io_pool.submit(self._write_temp_file, path, data)
+        future.add_done_callback(
+            lambda f, n=filename, p=path: self._post_to_tk(self._on_temp_written, n, p, f))
+
+    def _on_temp_written(self, filename: str, path: str, future: Future) -> None:
+        self._pending_writes.discard(filename)
+        error = future.exception()
+        if error is not None:
+            logger.error("Temp write failed: %s", error)
+            if self._current_filename == filename:
+                self._status.set("Failed to prepare media")
+            return
+        self._temp_paths[filename] = path
+        self._evict_temp_files()
+        # The user may have moved on to another video meanwhile
+        if self._current_filename == filename:
+            self._open_vlc(path)
+
+    def _evict_temp_files(self) -> None:
+        """Delete least recently used temp files beyond ``_MAX_TEMP_FILES``."""
+        while len(self._temp_paths) > _MAX_TEMP_FILES:
+            filename, path = self._temp_paths.popitem(last=False)
+            if filename == self._current_filename:
+                # Never delete the file that is (about to be) playing
                 self._temp_paths[filename] = path
+                if len(self._temp_paths) <= 1:
+                    return
+                continue
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+
+    @classmethod
+    def _load_vlc(cls) -> Any:
+        """Return the python-vlc module, or None if it cannot be loaded."""
+        if cls._vlc_mod is None and not cls._vlc_unavailable:
+            try:
+                import vlc  # type: ignore
+                instance = vlc.Instance(['--no-video-title-show', '--quiet'])
+                if instance is None:
+                    raise RuntimeError("libVLC failed to initialise")
+                cls._shared_instance = instance
+                cls._vlc_mod = vlc
             except Exception as e:
-                logger.error("Temp write failed: %s", e)
-                self._status.set("Failed to prepare media")
-                return
-        self._open_vlc(path)
+                logger.warning("VLC backend unavailable: %s", e)
+                cls._vlc_unavailable = True
+        return cls._vlc_mod
 
     def _open_vlc(self, path: str) -> None:
-        self._close_vlc()
-        try:
-            import vlc  # type: ignore
-        except Exception:
+        self._stop_media()
+        vlc = self._load_vlc()
+        if vlc is None:
             self._placeholder.configure(text="VLC backend not available (install python-vlc)")
             self._status.set("")
             return
         try:
             # Ensure the surface is realized/mapped before embedding
-            try:
-                wid = int(self._surface.winfo_id())
-            except Exception:
-                wid = 0
-            if wid == 0 or not self._surface.winfo_ismapped():
-                # Defer initialization slightly until the widget is ready
-                self.after(100, lambda p=path: self._open_vlc(p))
+            if not self._surface.winfo_ismapped():
+                # Open once Tk maps the surface; only the latest request wins
+                if self._pending_open_path is None:
+                    self._surface.bind('<Map>', self._on_surface_mapped)
+                self._pending_open_path = path
+                return
+            if not self._ensure_player(vlc):
                 return
+            self._load_media(path)
+        except Exception as e:
+            logger.error("VLC open failed: %s", e)
+            self._status.set("Cannot open video")
 
-            self._vlc_instance = vlc.Instance()
-            self._vlc_player = self._vlc_instance.media_player_new()
-            media = self._vlc_instance.media_new(path)
-            self._vlc_player.set_media(media)
-            # Embed with platform-specific handle
+    def _ensure_player(self, vlc: Any) -> bool:
+        """Create and embed the panel's media player once; later clips reuse it."""
+        if self._embedded_player is not None:
+            return True
+        self._vlc_instance = self._shared_instance
+        player = self._vlc_instance.media_player_new()
+        # Embed with platform-specific handle
+        try:
+            wid = int(self._surface.winfo_id())
+            if sys.platform.startswith('win'):
+                player.set_hwnd(wid)
+            elif sys.platform == 'darwin':
+                player.set_nsobject(wid)
+            else:
+                player.set_xwindow(wid)
+        except Exception:
+            # If embedding fails, show a message and avoid crashing
+            self._placeholder.configure(text="Video preview not embeddable on this system")
+            self._status.set("")
             try:
-                if sys.platform.startswith('win'):
-                    self._vlc_player.set_hwnd(wid)
-                elif sys.platform == 'darwin':
-                    self._vlc_player.set_nsobject(wid)
-                else:
-                    self._vlc_player.set_xwindow(wid)
+                player.release()
             except Exception:
-                # If embedding fails, show a message and avoid crashing
-                self._placeholder.configure(text="Video preview not embeddable on this system")
-                self._status.set("")
-                self._vlc_player = None
-                self._vlc_instance = None
-                return
-            # Do not autoplay; pause on first frame for preview
-            self._btn_play.configure(text=self.PLAY_ICON)
-            self._status.set("Ready")
-            self._placeholder.configure(text="")
-            # Reset known duration
-            self._duration_ms = 0
-            # Apply initial audio settings
+                pass
+            return False
+        # Drive the timeline from libVLC events instead of polling. libVLC
+        # runs these on its own thread and stop()/set_media() wait for it,
+        # so they only queue the event; _drain_events applies it on Tk.
+        # The player is reused across clips, so each event carries the
+        # load it belongs to
+        try:
+            em = player.event_manager()
+            ev = vlc.EventType
+            put = self._events.put
+            em.event_attach(ev.MediaPlayerTimeChanged,
+                            lambda e: put((self._load_gen, self._apply_time, int(e.u.new_time))))
+            em.event_attach(ev.MediaPlayerLengthChanged,
+                            lambda e: put((self._load_gen, self._apply_length, int(e.u.new_length))))
+            em.event_attach(ev.MediaPlayerPlaying,
+                            lambda e: put((self._load_gen, self._apply_playing, True)))
+            em.event_attach(ev.MediaPlayerPaused,
+                            lambda e: put((self._load_gen, self._apply_playing, False)))
+            em.event_attach(ev.MediaPlayerEndReached,
+                            lambda e: put((self._load_gen, self._on_media_end, None)))
+        except Exception:
+            pass
+        self._embedded_player = player
+        return True
+
+    def _load_media(self, path: str) -> None:
+        """Load ``path`` into the embedded player, paused on its first frame."""
+        # Previous clip is stopped, so its events are all queued by now
+        self._load_gen += 1
+        self._embedded_player.set_media(self._vlc_instance.media_new(path))
+        self._vlc_player = self._embedded_player
+        # Volume/mute changes made while no clip was loaded were not applied
+        try:
+            self._vlc_player.audio_set_volume(int(self._vol.get()))
+            self._vlc_player.audio_set_mute(bool(self._mute_var.get()))
+        except Exception:
+            pass
+        # Do not autoplay; pause on first frame for preview
+        self._btn_play.configure(text=self.PLAY_ICON)
+        self._status.set("Ready")
+        self._placeholder.configure(text="")
+        # Reset known duration
+        self._duration_ms = 0
+        self._last_displayed_sec = -1
+        self._last_seek_val = -1
+        # Render first frame then restore last position if configured
+        try:
+            # Kick VLC to render the first frame without playing
+            self._prepare_first_frame()
+            self._start_timeline()
+            remember = bool(((self.plugin_config or {}).get('ui_settings', {})
+                              .get('video_preview_panel', {})
+                              .get('remember_positions', True)))
+            if remember and self._current_filename in self._last_pos_ms_by_file:
+                pos = int(self._last_pos_ms_by_file[self._current_filename])
+                self.after(150, lambda: self._safe_set_time(pos))
+        except Exception:
+            pass
+
+    def _on_surface_mapped(self, _evt: Any) -> None:
+        self._surface.unbind('<Map>')
+        path, self._pending_open_path = self._pending_open_path, None
+        if path:
+            self._open_vlc(path)
+
+    def _stop_media(self) -> None:
+        """Stop the current clip; the embedded player is kept for the next one."""
+        # Drop a clip still waiting for <Map> so it cannot open later
+        if self._pending_open_path is not None:
+            self._pending_open_path = None
             try:
-                self._vlc_player.audio_set_volume(int(self._vol.get()))
-                self._vlc_player.audio_set_mute(bool(self._mute_var.get()))
+                self._surface.unbind('<Map>')
             except Exception:
                 pass
-            # Render first frame then restore last position if configured
+        if self._vlc_player:
             try:
-                # Kick VLC to render the first frame without playing
-                self._prepare_first_frame()
-                remember = bool(((self.plugin_config or {}).get('ui_settings', {})
-                                  .get('video_preview_panel', {})
-                                  .get('remember_positions', True)))
-                if remember and self._current_filename in self._last_pos_ms_by_file:
-                    pos = int(self._last_pos_ms_by_file[self._current_filename])
-                    self.after(150, lambda: self._safe_set_time(pos))
+                self._vlc_player.stop()
             except Exception:
                 pass
-        except Exception as e:
-            logger.error("VLC open failed: %s", e)
-            self._status.set("Cannot open video")
-
-    def _close_vlc(self) -> None:
-        try:
-            if self._vlc_player:
-                try:
-                    self._vlc_player.stop()
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        self._stop_poll()
         self._vlc_player = None
-        self._vlc_instance = None
+        self._playing = False
+        self._stop_timeline()
         try:
             self._btn_play.configure(text="Play")
         except Exception:
             pass
 
+    def _release_player(self) -> None:
+        """Stop playback and release the embedded player (panel teardown)."""
+        for job in (self._seek_apply_job, self._vol_job, self._label_update_job):
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+        self._seek_apply_job = self._vol_job = self._label_update_job = None
+        self._stop_media()
+        player, self._embedded_player = self._embedded_player, None
+        if player is not None:
+            try:
+                player.stop()
+                player.release()
+            except Exception:
+                pass
+        self._vlc_instance = None
+
     def _on_play_pause(self) -> None:
         if not self._vlc_player:
             return
@@ -384,11 +575,13 @@ class VideoPreviewPanel(ttk.Frame):
             # Use is_playing() for reliable toggle
             if self._vlc_player.is_playing():
                 self._vlc_player.pause()
+                self._playing = False
                 self._btn_play.configure(text=self.PLAY_ICON)
             else:
                 self._vlc_player.play()
+                self._playing = True
                 self._btn_play.configure(text=self.PAUSE_ICON)
-            self._start_poll()
+                self._start_timeline()
         except Exception:
             pass
 
@@ -397,12 +590,25 @@ class VideoPreviewPanel(ttk.Frame):
             return
         try:
             self._vlc_player.stop()
+            self._playing = False
             self._btn_play.configure(text=self.PLAY_ICON)
             self._status.set("Ready")
-            self._stop_poll()
         except Exception:
             pass
 
+    @staticmethod
+    def _write_temp_file(path: str, data: Any) -> None:
+        """Write a media blob unbuffered, straight from its memory (no extra copy)."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(path, flags, 0o600)
+        try:
+            view = memoryview(data)
+            # os.write may accept only part of a large buffer
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
     @staticmethod
     def _strip_media(href: str) -> str:
         return href[6:] if href.startswith('media/') else href
@@ -439,10 +645,14 @@ class VideoPreviewPanel(ttk.Frame):
             pass
 
     def _get_length_ms(self) -> int:
+        # Length is fixed per media: served from the LengthChanged event, and
+        # only queried from libVLC until that has arrived
+        if self._duration_ms > 0:
+            return self._duration_ms
         try:
             if self._vlc_player:
-                length = int(self._vlc_player.get_length() or 0)
-                return max(0, length)
+                self._duration_ms = max(0, int(self._vlc_player.get_length() or 0))
+                return self._duration_ms
         except Exception:
             pass
         return 0
@@ -454,42 +664,93 @@ class VideoPreviewPanel(ttk.Frame):
         return min(max(0, ms), length)
 
     def _format_ms(self, ms: int) -> str:
+        # Output changes once per second, so memoize on whole seconds
+        return _fmt_seconds(max(0, int(ms) // 1000))
+
+    def _request_label_update(self) -> None:
+        """Queue one time-label refresh for the next idle slot."""
+        if self._label_update_job is not None:
+            return
         try:
-            s = max(0, int(ms // 1000))
-            m, s = divmod(s, 60)
-            h, m = divmod(m, 60)
-            if h:
-                return f"{h:02d}:{m:02d}:{s:02d}"
-            return f"{m:02d}:{s:02d}"
+            self._label_update_job = self.after_idle(self._do_label_update)
         except Exception:
-            return "00:00"
+            # Panel already destroyed
+            pass
+
+    def _do_label_update(self) -> None:
+        self._label_update_job = None
+        self._update_time_label_from_player()
+        # Seeks while paused: also apply the TimeChanged they trigger
+        if self._vlc_player:
+            self._start_timeline()
 
     def _update_time_label_from_player(self) -> None:
-        try:
-            cur = 0
-            if self._vlc_player:
+        cur = 0
+        if self._vlc_player:
+            try:
                 cur = int(self._vlc_player.get_time() or 0)
-            total = self._get_length_ms()
-            self._lbl_time.configure(text=f"{self._format_ms(cur)} / {self._format_ms(total)}")
-        except Exception:
-            pass
+            except Exception:
+                return
+        self._set_time_label(cur, self._get_length_ms())
+
+    def _set_time_label(self, cur_ms: int, total_ms: int) -> None:
+        self._last_displayed_sec = max(0, int(cur_ms)) // 1000
+        text = f"{self._format_ms(cur_ms)} / {self._format_ms(total_ms)}"
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self._lbl_time.configure(text=text)
+
+    def _set_seek_pos(self, pos: int) -> None:
+        """Move the seek bar programmatically, skipping unchanged positions."""
+        pos = max(0, min(1000, int(pos)))
+        if pos == self._last_seek_val:
+            return
+        self._last_seek_val = pos
+        self._updating_seek = True
+        try:
+            self._seek.set(pos)
+        finally:
+            self._updating_seek = False
 
     def _on_seek(self, value: Any) -> None:
-        if not self._vlc_player:
+        # Fires per pixel while dragging: plain guards, no exception frame
+        if not self._vlc_player or self._updating_seek:
+            return
+        # Scale is 0..1000 (always numeric); map to media length
+        pos = max(0.0, min(1000.0, float(value)))
+        # The user moved the bar; keep the redraw guard in sync
+        self._last_seek_val = int(pos)
+        length = self._get_length_ms()
+        if length <= 0:
+            return
+        target = self._clamp_time(int((pos / 1000.0) * length))
+        if self._user_seeking:
+            # Preview at most every 60 ms while dragging
+            self._pending_seek_ms = target
+            if self._seek_apply_job is None:
+                self._seek_apply_job = self.after(60, self._apply_pending_seek)
             return
         try:
-            # Scale is 0..1000; map to media length
-            if self._updating_seek:
-                return
-            pos = float(value)
-            pos = max(0.0, min(1000.0, pos))
-            length = self._get_length_ms()
-            if length > 0:
-                target = int((pos / 1000.0) * length)
-                self._vlc_player.set_time(self._clamp_time(target))
-                self._update_time_label_from_player()
+            self._vlc_player.set_time(target)
         except Exception:
-            pass
+            return
+        self._request_label_update()
+
+    def _apply_pending_seek(self) -> None:
+        if self._seek_apply_job is not None:
+            try:
+                self.after_cancel(self._seek_apply_job)
+            except Exception:
+                pass
+            self._seek_apply_job = None
+        target, self._pending_seek_ms = self._pending_seek_ms, None
+        if target is None or not self._vlc_player:
+            return
+        try:
+            self._vlc_player.set_time(target)
+        except Exception:
+            return
+        self._request_label_update()
 
     def _on_seek_click(self, event: Any) -> None:
         try:
@@ -507,35 +768,44 @@ class VideoPreviewPanel(ttk.Frame):
             return
         try:
             cur = int(self._vlc_player.get_time() or 0)
-            self._vlc_player.set_time(self._clamp_time(cur + int(delta_ms)))
-            self._update_time_label_from_player()
+            self._vlc_player.set_time(self._clamp_time(cur + delta_ms))
         except Exception:
-            pass
+            return
+        self._request_label_update()
 
     def _seek_ms(self, ms: int) -> None:
         if not self._vlc_player:
             return
         try:
-            self._vlc_player.set_time(self._clamp_time(int(ms)))
-            self._update_time_label_from_player()
+            self._vlc_player.set_time(self._clamp_time(ms))
         except Exception:
-            pass
+            return
+        self._request_label_update()
 
     def _jump_to_end(self) -> None:
         length = self._get_length_ms()
-        if length > 0:
-            try:
-                self._vlc_player.set_time(self._clamp_time(length - 200))
-                self._update_time_label_from_player()
-            except Exception:
-                pass
+        if length <= 0 or not self._vlc_player:
+            return
+        try:
+            self._vlc_player.set_time(self._clamp_time(length - 200))
+        except Exception:
+            return
+        self._request_label_update()
 
     def _on_volume(self, value: Any) -> None:
         if not self._vlc_player:
             return
+        # Scale fires per pixel while dragging: apply the latest value after 30 ms
+        self._pending_vol = max(0, min(100, int(float(value))))
+        if self._vol_job is None:
+            self._vol_job = self.after(30, self._commit_volume)
+
+    def _commit_volume(self) -> None:
+        self._vol_job = None
+        vol, self._pending_vol = self._pending_vol, None
+        if vol is None or not self._vlc_player:
+            return
         try:
-            vol = int(float(value))
-            vol = max(0, min(100, vol))
             self._vlc_player.audio_set_volume(vol)
         except Exception:
             pass
@@ -553,7 +823,7 @@ class VideoPreviewPanel(ttk.Frame):
             return
         try:
             raw = str(self._speed_var.get() or "1.0x")
-            m = re.search(r"\d+(?:[\.,]\d+)?", raw)
+            m = _SPEED_RE.search(raw)
             rate = 1.0
             if m:
                 rate = float(m.group(0).replace(',', '.'))
@@ -562,7 +832,7 @@ class VideoPreviewPanel(ttk.Frame):
             pass
 
     # -------------------------------
-    # Polling and helpers
+    # Player events and helpers
     # -------------------------------
     def _safe_set_time(self, ms: int) -> None:
         try:
@@ -572,76 +842,99 @@ class VideoPreviewPanel(ttk.Frame):
             pass
 
     def _prepare_first_frame(self) -> None:
-        """Start-stop quickly so the first frame is rendered but remain paused."""
+        """Render the first frame into the surface while staying paused."""
+        if not self._vlc_player:
+            return
         try:
-            if not self._vlc_player:
+            # python-vlc reports failures as return codes, not exceptions
+            if self._vlc_player.play() == -1:
+                self._status.set("Cannot open video")
                 return
-            # Start briefly to force video surface to render
-            self._vlc_player.play()
-            def _pause_at_zero() -> None:
-                try:
-                    self._vlc_player.set_time(0)
-                    self._vlc_player.pause()
-                    self._btn_play.configure(text=self.PLAY_ICON)
-                    # Update time label/seek
-                    self._update_time_label_from_player()
-                    self._updating_seek = True
-                    try:
-                        self._seek.set(0)
-                    finally:
-                        self._updating_seek = False
-                except Exception:
-                    pass
-            self.after(200, _pause_at_zero)
+            # Start already paused and step one frame: no clock/audio run-up
+            self._vlc_player.set_pause(1)
+            self._vlc_player.next_frame()
+            self._vlc_player.set_time(0)
+            self._btn_play.configure(text=self.PLAY_ICON)
+            self._request_label_update()
+            self._set_seek_pos(0)
         except Exception:
             pass
 
     def _set_user_seeking(self, seeking: bool) -> None:
         self._user_seeking = bool(seeking)
+        if not self._user_seeking:
+            # Drag ended: apply the final position right away
+            self._apply_pending_seek()
 
-    def _get_poll_interval(self) -> int:
+    def _post_to_tk(self, func: Any, *args: Any) -> None:
+        """Schedule ``func`` on the Tk thread from a worker thread.
+
+        Not for libVLC callbacks: those go through ``self._events``.
+        """
         try:
-            return int(((self.plugin_config or {}).get('ui_settings', {})
-                        .get('video_preview_panel', {})
-                        .get('poll_interval_ms', 200)))
+            self.after_idle(func, *args)
         except Exception:
-            return 200
+            # Panel already destroyed
+            pass
+
+    def _start_timeline(self) -> None:
+        """Start applying queued libVLC events; the loop ends once playback stops."""
+        if self._timeline_job is None:
+            try:
+                self._timeline_job = self.after(_TIMELINE_INTERVAL_MS, self._drain_events)
+            except Exception:
+                # Panel already destroyed
+                pass
+
+    def _stop_timeline(self) -> None:
+        if self._timeline_job is not None:
+            try:
+                self.after_cancel(self._timeline_job)
+            except Exception:
+                pass
+            self._timeline_job = None
 
-    def _start_poll(self) -> None:
-        if self._poll_job is not None:
+    def _drain_events(self) -> None:
+        self._timeline_job = None
+        drained = False
+        while True:
+            try:
+                gen, apply, value = self._events.get_nowait()
+            except queue.Empty:
+                break
+            drained = True
+            if self._vlc_player and gen == self._load_gen:
+                apply(value)
+        # libVLC's thread must not call into Tk (stop()/set_media() on the Tk
+        # thread wait for it), so this loop is what wakes up for its events.
+        # Keep going while events say we are playing, plus one more pass
+        # after the last event so late Paused/EndReached are still applied
+        if self._vlc_player and (self._playing or drained):
+            self._start_timeline()
+
+    def _apply_time(self, cur_ms: int) -> None:
+        total = self._get_length_ms()
+        # Update time label only when the displayed second changes
+        if cur_ms // 1000 != self._last_displayed_sec:
+            self._set_time_label(cur_ms, total)
+        # Update seek position if user isn't dragging
+        if not self._user_seeking and total > 0:
+            self._set_seek_pos(int((cur_ms / total) * 1000))
+
+    def _apply_length(self, length_ms: int) -> None:
+        if length_ms <= 0:
             return
-        self._poll_job = self.after(self._get_poll_interval(), self._poll)
+        self._duration_ms = length_ms
+        self._request_label_update()
 
-    def _stop_poll(self) -> None:
-        try:
-            if self._poll_job is not None:
-                self.after_cancel(self._poll_job)
-        except Exception:
-            pass
-        self._poll_job = None
+    def _apply_playing(self, playing: bool) -> None:
+        self._playing = playing
+        self._btn_play.configure(text=self.PAUSE_ICON if playing else self.PLAY_ICON)
 
-    def _poll(self) -> None:
+    def _on_media_end(self, _value: Any) -> None:
+        self._playing = False
         try:
-            if self._vlc_player:
-                # Update duration lazily once available
-                if self._duration_ms <= 0:
-                    dur = int(self._vlc_player.get_length() or 0)
-                    if dur > 0:
-                        self._duration_ms = dur
-                # Update time label
-                self._update_time_label_from_player()
-                # Update seek position if user isn't dragging
-                if not self._user_seeking:
-                    total = self._duration_ms if self._duration_ms > 0 else self._get_length_ms()
-                    if total > 0:
-                        cur = int(self._vlc_player.get_time() or 0)
-                        pos = int((cur / max(1, total)) * 1000)
-                        self._updating_seek = True
-                        try:
-                            self._seek.set(max(0, min(1000, pos)))
-                        finally:
-                            self._updating_seek = False
+            self._btn_play.configure(text=self.PLAY_ICON)
+            self._request_label_update()
         except Exception:
             pass
-        # Reschedule
-        self._poll_job = self.after(self._get_poll_interval(), self._poll)